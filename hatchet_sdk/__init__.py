@@ -129,7 +129,7 @@ from hatchet_sdk.clients.run_event_listener import (
     StepRunEventType,
     WorkflowRunEventType,
 )
-from hatchet_sdk.context.context import Context
+from hatchet_sdk.context.context import Context, StepRunCancelledError
 from hatchet_sdk.context.worker_context import WorkerContext
 from hatchet_sdk.contracts.workflows_pb2 import (
     CreateWorkflowVersionOpts,
@@ -240,6 +240,7 @@ __all__ = [
     "StepRunEventType",
     "WorkflowRunEventType",
     "Context",
+    "StepRunCancelledError",
     "WorkerContext",
     "ClientConfig",
     "Hatchet",
@@ -1,4 +1,3 @@
-import asyncio
 import json
 from datetime import datetime
 from typing import Any, Union, cast
@@ -26,6 +25,7 @@ from hatchet_sdk.contracts.workflows_pb2 import (
 from hatchet_sdk.contracts.workflows_pb2_grpc import WorkflowServiceStub
 from hatchet_sdk.loader import ClientConfig
 from hatchet_sdk.metadata import get_metadata
+from hatchet_sdk.utils.aio_utils import to_thread_fast
 from hatchet_sdk.utils.types import JSONSerializableDict
 from hatchet_sdk.workflow_run import WorkflowRunRef
 
@@ -162,7 +162,7 @@ class AdminClient:
         if not self.pooled_workflow_listener:
             self.pooled_workflow_listener = PooledWorkflowRunListener(self.config)
 
-        return await asyncio.to_thread(self.run_workflow, workflow_name, input, options)
+        return await to_thread_fast(self.run_workflow, workflow_name, input, options)
 
     @tenacity_retry
     async def aio_run_workflows(
@@ -176,7 +176,7 @@ class AdminClient:
         if not self.pooled_workflow_listener:
             self.pooled_workflow_listener = PooledWorkflowRunListener(self.config)
 
-        return await asyncio.to_thread(self.run_workflows, workflows, options)
+        return await to_thread_fast(self.run_workflows, workflows, options)
 
     @tenacity_retry
     async def aio_put_workflow(
@@ -191,7 +191,7 @@ class AdminClient:
         if not self.pooled_workflow_listener:
             self.pooled_workflow_listener = PooledWorkflowRunListener(self.config)
 
-        return await asyncio.to_thread(self.put_workflow, name, workflow, overrides)
+        return await to_thread_fast(self.put_workflow, name, workflow, overrides)
 
     @tenacity_retry
     async def aio_put_rate_limit(
@@ -206,7 +206,7 @@ class AdminClient:
         if not self.pooled_workflow_listener:
             self.pooled_workflow_listener = PooledWorkflowRunListener(self.config)
 
-        return await asyncio.to_thread(self.put_rate_limit, key, limit, duration)
+        return await to_thread_fast(self.put_rate_limit, key, limit, duration)
 
     @tenacity_retry
     async def aio_schedule_workflow(
@@ -222,7 +222,7 @@ class AdminClient:
         if not self.pooled_workflow_listener:
             self.pooled_workflow_listener = PooledWorkflowRunListener(self.config)
 
-        return await asyncio.to_thread(
+        return await to_thread_fast(
             self.schedule_workflow, name, schedules, input, options
         )
 
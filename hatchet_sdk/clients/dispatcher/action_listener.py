@@ -2,6 +2,7 @@ import asyncio
 import json
 import time
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, AsyncGenerator, Optional, cast
 
 import grpc
@@ -86,7 +87,8 @@ class Action:
         if not isinstance(self.additional_metadata, dict):
             self.additional_metadata = {}
 
-    @property
+    # Serializing the payload is the expensive part, so it's done at most once per action
+    @cached_property
     def otel_attributes(self) -> dict[str, str | int]:
         try:
             payload_str = json.dumps(self.action_payload, default=str)
@@ -1,13 +1,17 @@
 import asyncio
-import datetime
-import json
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, cast
 
 import grpc
+import orjson
 from google.protobuf import timestamp_pb2
 from pydantic import BaseModel, Field
 
 from hatchet_sdk.clients.rest.tenacity_utils import tenacity_retry
+from hatchet_sdk.connection import new_conn
 from hatchet_sdk.contracts.events_pb2 import (
     BulkPushEventRequest,
     Event,
@@ -17,21 +21,30 @@ from hatchet_sdk.contracts.events_pb2 import (
 )
 from hatchet_sdk.contracts.events_pb2_grpc import EventsServiceStub
 from hatchet_sdk.loader import ClientConfig
+from hatchet_sdk.logger import logger
 from hatchet_sdk.metadata import get_metadata
 from hatchet_sdk.utils.types import JSONSerializableDict
 
+# Batches at least this large are encoded on a worker thread by `aio_bulk_push`, so that
+# serializing them doesn't stall the event loop. Smaller batches aren't worth the thread hop.
+AIO_BULK_PUSH_OFFLOAD_THRESHOLD = 100
+
 
 def new_event(conn: grpc.Channel, config: ClientConfig) -> "EventClient":
+    pool = [EventsServiceStub(conn)] + [  # type: ignore[no-untyped-call]
+        EventsServiceStub(new_conn(config, False, local_subchannel_pool=True))  # type: ignore[no-untyped-call]
+        for _ in range(config.grpc_channel_pool_size - 1)
+    ]
+
     return EventClient(
-        client=EventsServiceStub(conn),  # type: ignore[no-untyped-call]
+        client=pool[0],
         config=config,
+        pool=pool,
     )
 
 
 def proto_timestamp_now() -> timestamp_pb2.Timestamp:
-    t = datetime.datetime.now().timestamp()
-    seconds = int(t)
-    nanos = int(t % 1 * 1e9)
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
 
     return timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos)
 
@@ -52,85 +65,289 @@ class BulkPushEventWithMetadata(BaseModel):
 
 
 class EventClient:
-    def __init__(self, client: EventsServiceStub, config: ClientConfig):
+    def __init__(
+        self,
+        client: EventsServiceStub,
+        config: ClientConfig,
+        pool: list[EventsServiceStub] | None = None,
+    ):
         self.client = client
+        self.config = config
         self.token = config.token
         self.namespace = config.namespace
+        self._metadata = get_metadata(self.token)
+        self._bulk_compression = (
+            grpc.Compression.Gzip
+            if config.grpc_compression
+            else grpc.Compression.NoCompression
+        )
+
+        # Each stub in the pool is backed by its own channel, so concurrent calls are spread
+        # across several HTTP/2 connections instead of multiplexing over a single one.
+        self._stubs = pool or [client]
+        self._rr = itertools.count()
+
+        self._aio_client: EventsServiceStub | None = None
+        self._aio_loop: asyncio.AbstractEventLoop | None = None
+
+        # Encoding holds the GIL, so a single thread is enough to keep the loop responsive
+        self._serializer_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hatchet-event-encoder"
+        )
+
+        self._batch: list[PushEventRequest] = []
+        self._batch_cond = threading.Condition()
+        self._batch_flusher: threading.Thread | None = None
+        self._batch_closed = False
+        # Batches the flusher thread has taken but not finished sending, so `flush` can wait for them
+        self._batches_in_flight = 0
+
+    def _stub(self) -> EventsServiceStub:
+        return self._stubs[next(self._rr) % len(self._stubs)]
 
+    @property
+    def aio_client(self) -> EventsServiceStub:
+        ## IMPORTANT: The async stub must be created lazily, from within the event loop that will use it,
+        ## otherwise the grpc.aio channel ends up attached to the wrong event loop. It's rebuilt whenever
+        ## it's used from another loop (e.g. across `asyncio.run` calls), since the old one may be closed.
+        loop = asyncio.get_running_loop()
+
+        if self._aio_client is None or self._aio_loop is not loop:
+            self._aio_client = EventsServiceStub(  # type: ignore[no-untyped-call]
+                new_conn(self.config, True, local_subchannel_pool=True)
+            )
+            self._aio_loop = loop
+
+        return self._aio_client
+
+    ## IMPORTANT: Keep this method's signature in sync with the wrapper in the OTel instrumentor
+    @tenacity_retry
     async def aio_push(
         self,
         event_key: str,
         payload: dict[str, Any],
         options: PushEventOptions = PushEventOptions(),
     ) -> Event:
-        return await asyncio.to_thread(
-            self.push, event_key=event_key, payload=payload, options=options
+        request = self._create_push_request(event_key, payload, options)
+
+        return cast(
+            Event,
+            await self.aio_client.Push(
+                request,
+                metadata=self._metadata,
+                compression=grpc.Compression.NoCompression,
+            ),
         )
 
+    ## IMPORTANT: Keep this method's signature in sync with the wrapper in the OTel instrumentor
+    @tenacity_retry
     async def aio_bulk_push(
         self,
         events: list[BulkPushEventWithMetadata],
         options: BulkPushEventOptions = BulkPushEventOptions(),
     ) -> List[Event]:
-        return await asyncio.to_thread(self.bulk_push, events=events, options=options)
+        if len(events) >= AIO_BULK_PUSH_OFFLOAD_THRESHOLD:
+            bulk_request = await asyncio.get_running_loop().run_in_executor(
+                self._serializer_pool, self._create_bulk_push_request, events, options
+            )
+        else:
+            bulk_request = self._create_bulk_push_request(events, options)
 
-    ## IMPORTANT: Keep this method's signature in sync with the wrapper in the OTel instrumentor
-    @tenacity_retry
-    def push(
+        response = await self.aio_client.BulkPush(
+            bulk_request,
+            metadata=self._metadata,
+            compression=self._bulk_compression,
+        )
+
+        return cast(
+            list[Event],
+            response.events,
+        )
+
+    def _create_push_request(
         self,
         event_key: str,
         payload: dict[str, Any],
-        options: PushEventOptions = PushEventOptions(),
-    ) -> Event:
+        options: PushEventOptions,
+    ) -> PushEventRequest:
         namespace = options.namespace or self.namespace
         namespaced_event_key = namespace + event_key
 
         try:
             meta = options.additional_metadata
-            meta_bytes = None if meta is None else json.dumps(meta)
-        except Exception as e:
+            meta_bytes = None if meta is None else orjson.dumps(meta)
+        except orjson.JSONEncodeError as e:
             raise ValueError(f"Error encoding meta: {e}")
 
         try:
-            payload_str = json.dumps(payload)
-        except (TypeError, ValueError) as e:
+            payload_bytes = orjson.dumps(payload)
+        except orjson.JSONEncodeError as e:
             raise ValueError(f"Error encoding payload: {e}")
 
-        request = PushEventRequest(
+        # protobuf accepts UTF-8 encoded bytes for string fields, so the encoded JSON is passed
+        # through as-is instead of being decoded to a str first
+        return PushEventRequest(
             key=namespaced_event_key,
-            payload=payload_str,
+            payload=payload_bytes,  # type: ignore[arg-type]
             eventTimestamp=proto_timestamp_now(),
-            additionalMetadata=meta_bytes,
+            additionalMetadata=meta_bytes,  # type: ignore[arg-type]
         )
 
-        return cast(Event, self.client.Push(request, metadata=get_metadata(self.token)))
+    ## IMPORTANT: Keep this method's signature in sync with the wrapper in the OTel instrumentor
+    @tenacity_retry
+    def push(
+        self,
+        event_key: str,
+        payload: dict[str, Any],
+        options: PushEventOptions = PushEventOptions(),
+    ) -> Event:
+        request = self._create_push_request(event_key, payload, options)
+
+        return cast(Event, self._stub().Push(request, metadata=self._metadata))
 
-    def _create_push_event_request(
+    def push_batched(
         self,
-        event: BulkPushEventWithMetadata,
-        namespace: str,
-    ) -> PushEventRequest:
-        event_key = namespace + event.key
-        payload = event.payload
+        event_key: str,
+        payload: dict[str, Any],
+        options: PushEventOptions = PushEventOptions(),
+    ) -> None:
+        """Buffers an event to be sent with others in a single `BulkPush`.
+
+        Buffered events are flushed by a background thread every `event_batch_window_ms`,
+        or as soon as `event_batch_max_size` of them are waiting. Call `flush` or `close`
+        to send whatever is buffered before exiting.
+        """
+        # The request is built here so that encoding errors surface to the caller, and so the
+        # event is timestamped when it was pushed rather than when its batch is flushed
+        request = self._create_push_request(event_key, payload, options)
+
+        with self._batch_cond:
+            if self._batch_closed:
+                raise RuntimeError("Cannot push to a closed event client")
+
+            self._batch.append(request)
+
+            if self._batch_flusher is None:
+                self._batch_flusher = threading.Thread(
+                    target=self._run_batch_flusher,
+                    name="hatchet-event-flusher",
+                    daemon=True,
+                )
+                self._batch_flusher.start()
+
+            if len(self._batch) >= self.config.event_batch_max_size:
+                self._batch_cond.notify_all()
+
+    def flush(self) -> None:
+        """Sends every buffered event, returning once batches already being sent are done too."""
+        with self._batch_cond:
+            pending, self._batch = self._batch, []
+
+        max_size = self.config.event_batch_max_size
+
+        for i in range(0, len(pending), max_size):
+            self._send_batch(pending[i : i + max_size])
+
+        with self._batch_cond:
+            self._batch_cond.wait_for(lambda: self._batches_in_flight == 0)
+
+    def close(self) -> None:
+        with self._batch_cond:
+            self._batch_closed = True
+            self._batch_cond.notify_all()
+
+        if self._batch_flusher is not None:
+            self._batch_flusher.join()
+
+        ## IMPORTANT: The serializer pool is left running, `aio_bulk_push` doesn't go through the
+        ## batch and can still be called after the client is closed
+        self.flush()
+
+    def _run_batch_flusher(self) -> None:
+        window = self.config.event_batch_window_ms / 1000
+        max_size = self.config.event_batch_max_size
+
+        while True:
+            with self._batch_cond:
+                self._batch_cond.wait_for(lambda: self._batch or self._batch_closed)
+
+                if self._batch_closed:
+                    return
+
+                self._batch_cond.wait_for(
+                    lambda: len(self._batch) >= max_size or self._batch_closed,
+                    timeout=window,
+                )
+
+                if self._batch_closed:
+                    return
+
+                batch = self._batch[:max_size]
+                del self._batch[:max_size]
+                self._batches_in_flight += 1
+
+            try:
+                self._send_batch(batch)
+            except Exception:
+                logger.exception(f"failed to flush {len(batch)} batched events")
+            finally:
+                with self._batch_cond:
+                    self._batches_in_flight -= 1
+                    self._batch_cond.notify_all()
 
-        meta = event.additional_metadata
+    @tenacity_retry
+    def _send_batch(self, batch: list[PushEventRequest]) -> None:
+        if not batch:
+            return
+
+        self._stub().BulkPush(
+            BulkPushEventRequest(events=batch),
+            metadata=self._metadata,
+            compression=self._bulk_compression,
+        )
 
+    def _encode_bulk_push_event(
+        self, event: BulkPushEventWithMetadata
+    ) -> tuple[bytes, bytes]:
         try:
-            meta_str = json.dumps(meta)
-        except Exception as e:
+            meta_bytes = orjson.dumps(event.additional_metadata)
+        except orjson.JSONEncodeError as e:
             raise ValueError(f"Error encoding meta: {e}")
 
         try:
-            payload = json.dumps(payload)
-        except (TypeError, ValueError) as e:
+            payload_bytes = orjson.dumps(event.payload)
+        except orjson.JSONEncodeError as e:
             raise ValueError(f"Error encoding payload: {e}")
 
-        return PushEventRequest(
-            key=event_key,
-            payload=payload,
-            eventTimestamp=proto_timestamp_now(),
-            additionalMetadata=meta_str,
-        )
+        return payload_bytes, meta_bytes
+
+    def _create_bulk_push_request(
+        self,
+        events: List[BulkPushEventWithMetadata],
+        options: BulkPushEventOptions,
+    ) -> BulkPushEventRequest:
+        namespace = options.namespace or self.namespace
+
+        # protobuf copies the timestamp into each request, so one instance can be shared by the batch
+        event_timestamp = proto_timestamp_now()
+
+        bulk_request = BulkPushEventRequest()
+
+        # Adding each event in place builds it directly inside the batch, instead of building a
+        # standalone PushEventRequest that protobuf then has to copy into the repeated field
+        add_event = bulk_request.events.add
+
+        for event in events:
+            payload_bytes, meta_bytes = self._encode_bulk_push_event(event)
+
+            add_event(
+                key=namespace + event.key,
+                payload=payload_bytes,
+                eventTimestamp=event_timestamp,
+                additionalMetadata=meta_bytes,
+            )
+
+        return bulk_request
 
     ## IMPORTANT: Keep this method's signature in sync with the wrapper in the OTel instrumentor
     @tenacity_retry
@@ -139,16 +356,14 @@ class EventClient:
         events: List[BulkPushEventWithMetadata],
         options: BulkPushEventOptions = BulkPushEventOptions(),
     ) -> List[Event]:
-        namespace = options.namespace or self.namespace
+        bulk_request = self._create_bulk_push_request(events, options)
 
-        bulk_request = BulkPushEventRequest(
-            events=[
-                self._create_push_event_request(event, namespace) for event in events
-            ]
+        response = self._stub().BulkPush(
+            bulk_request,
+            metadata=self._metadata,
+            compression=self._bulk_compression,
         )
 
-        response = self.client.BulkPush(bulk_request, metadata=get_metadata(self.token))
-
         return cast(
             list[Event],
             response.events,
@@ -161,20 +376,51 @@ class EventClient:
             message=message,
         )
 
-        self.client.PutLog(request, metadata=get_metadata(self.token))
+        self._stub().PutLog(request, metadata=self._metadata)
 
-    def stream(self, data: str | bytes, step_run_id: str) -> None:
-        if isinstance(data, str):
+    async def aio_log(self, message: str, step_run_id: str) -> None:
+        request = PutLogRequest(
+            stepRunId=step_run_id,
+            createdAt=proto_timestamp_now(),
+            message=message,
+        )
+
+        await self.aio_client.PutLog(
+            request,
+            metadata=self._metadata,
+            compression=grpc.Compression.NoCompression,
+        )
+
+    def _create_put_stream_request(
+        self, data: str | bytes, step_run_id: str
+    ) -> PutStreamEventRequest:
+        # bytes is the common case for streamed data, and an exact class check is cheaper than
+        # isinstance. Subclasses of bytes still take the isinstance path below.
+        if data.__class__ is bytes:
+            data_bytes = data
+        elif isinstance(data, str):
             data_bytes = data.encode("utf-8")
         elif isinstance(data, bytes):
             data_bytes = data
         else:
             raise ValueError("Invalid data type. Expected str, bytes, or file.")
 
-        request = PutStreamEventRequest(
+        return PutStreamEventRequest(
             stepRunId=step_run_id,
             createdAt=proto_timestamp_now(),
             message=data_bytes,
         )
 
-        self.client.PutStreamEvent(request, metadata=get_metadata(self.token))
+    def stream(self, data: str | bytes, step_run_id: str) -> None:
+        request = self._create_put_stream_request(data, step_run_id)
+
+        self._stub().PutStreamEvent(request, metadata=self._metadata)
+
+    async def aio_stream(self, data: str | bytes, step_run_id: str) -> None:
+        request = self._create_put_stream_request(data, step_run_id)
+
+        await self.aio_client.PutStreamEvent(
+            request,
+            metadata=self._metadata,
+            compression=grpc.Compression.NoCompression,
+        )
@@ -14,25 +14,12 @@
 """  # noqa: E501
 
 
+from typing import Any
+
+from hatchet_sdk.clients.rest import api, models
+
 __version__ = "1.0.0"
 
-# import apis into sdk package
-from hatchet_sdk.clients.rest.api.api_token_api import APITokenApi
-from hatchet_sdk.clients.rest.api.default_api import DefaultApi
-from hatchet_sdk.clients.rest.api.event_api import EventApi
-from hatchet_sdk.clients.rest.api.github_api import GithubApi
-from hatchet_sdk.clients.rest.api.healthcheck_api import HealthcheckApi
-from hatchet_sdk.clients.rest.api.log_api import LogApi
-from hatchet_sdk.clients.rest.api.metadata_api import MetadataApi
-from hatchet_sdk.clients.rest.api.rate_limits_api import RateLimitsApi
-from hatchet_sdk.clients.rest.api.slack_api import SlackApi
-from hatchet_sdk.clients.rest.api.sns_api import SNSApi
-from hatchet_sdk.clients.rest.api.step_run_api import StepRunApi
-from hatchet_sdk.clients.rest.api.tenant_api import TenantApi
-from hatchet_sdk.clients.rest.api.user_api import UserApi
-from hatchet_sdk.clients.rest.api.worker_api import WorkerApi
-from hatchet_sdk.clients.rest.api.workflow_api import WorkflowApi
-from hatchet_sdk.clients.rest.api.workflow_run_api import WorkflowRunApi
 from hatchet_sdk.clients.rest.api_client import ApiClient
 
 # import ApiClient
@@ -46,248 +33,19 @@ from hatchet_sdk.clients.rest.exceptions import (
     ApiValueError,
     OpenApiException,
 )
-from hatchet_sdk.clients.rest.models.accept_invite_request import AcceptInviteRequest
 
-# import models into sdk package
-from hatchet_sdk.clients.rest.models.api_error import APIError
-from hatchet_sdk.clients.rest.models.api_errors import APIErrors
-from hatchet_sdk.clients.rest.models.api_meta import APIMeta
-from hatchet_sdk.clients.rest.models.api_meta_auth import APIMetaAuth
-from hatchet_sdk.clients.rest.models.api_meta_integration import APIMetaIntegration
-from hatchet_sdk.clients.rest.models.api_meta_posthog import APIMetaPosthog
-from hatchet_sdk.clients.rest.models.api_resource_meta import APIResourceMeta
-from hatchet_sdk.clients.rest.models.api_token import APIToken
-from hatchet_sdk.clients.rest.models.bulk_create_event_request import (
-    BulkCreateEventRequest,
-)
-from hatchet_sdk.clients.rest.models.cancel_event_request import CancelEventRequest
-from hatchet_sdk.clients.rest.models.concurrency_limit_strategy import (
-    ConcurrencyLimitStrategy,
-)
-from hatchet_sdk.clients.rest.models.create_api_token_request import (
-    CreateAPITokenRequest,
-)
-from hatchet_sdk.clients.rest.models.create_api_token_response import (
-    CreateAPITokenResponse,
-)
-from hatchet_sdk.clients.rest.models.create_cron_workflow_trigger_request import (
-    CreateCronWorkflowTriggerRequest,
-)
-from hatchet_sdk.clients.rest.models.create_event_request import CreateEventRequest
-from hatchet_sdk.clients.rest.models.create_pull_request_from_step_run import (
-    CreatePullRequestFromStepRun,
-)
-from hatchet_sdk.clients.rest.models.create_sns_integration_request import (
-    CreateSNSIntegrationRequest,
-)
-from hatchet_sdk.clients.rest.models.create_tenant_alert_email_group_request import (
-    CreateTenantAlertEmailGroupRequest,
-)
-from hatchet_sdk.clients.rest.models.create_tenant_invite_request import (
-    CreateTenantInviteRequest,
-)
-from hatchet_sdk.clients.rest.models.create_tenant_request import CreateTenantRequest
-from hatchet_sdk.clients.rest.models.cron_workflows import CronWorkflows
-from hatchet_sdk.clients.rest.models.cron_workflows_list import CronWorkflowsList
-from hatchet_sdk.clients.rest.models.cron_workflows_method import CronWorkflowsMethod
-from hatchet_sdk.clients.rest.models.cron_workflows_order_by_field import (
-    CronWorkflowsOrderByField,
-)
-from hatchet_sdk.clients.rest.models.event import Event
-from hatchet_sdk.clients.rest.models.event_data import EventData
-from hatchet_sdk.clients.rest.models.event_key_list import EventKeyList
-from hatchet_sdk.clients.rest.models.event_list import EventList
-from hatchet_sdk.clients.rest.models.event_order_by_direction import (
-    EventOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.event_order_by_field import EventOrderByField
-from hatchet_sdk.clients.rest.models.event_update_cancel200_response import (
-    EventUpdateCancel200Response,
-)
-from hatchet_sdk.clients.rest.models.event_workflow_run_summary import (
-    EventWorkflowRunSummary,
-)
-from hatchet_sdk.clients.rest.models.events import Events
-from hatchet_sdk.clients.rest.models.get_step_run_diff_response import (
-    GetStepRunDiffResponse,
-)
-from hatchet_sdk.clients.rest.models.info_get_version200_response import (
-    InfoGetVersion200Response,
-)
-from hatchet_sdk.clients.rest.models.job import Job
-from hatchet_sdk.clients.rest.models.job_run import JobRun
-from hatchet_sdk.clients.rest.models.job_run_status import JobRunStatus
-from hatchet_sdk.clients.rest.models.list_api_tokens_response import (
-    ListAPITokensResponse,
-)
-from hatchet_sdk.clients.rest.models.list_pull_requests_response import (
-    ListPullRequestsResponse,
-)
-from hatchet_sdk.clients.rest.models.list_slack_webhooks import ListSlackWebhooks
-from hatchet_sdk.clients.rest.models.list_sns_integrations import ListSNSIntegrations
-from hatchet_sdk.clients.rest.models.log_line import LogLine
-from hatchet_sdk.clients.rest.models.log_line_level import LogLineLevel
-from hatchet_sdk.clients.rest.models.log_line_list import LogLineList
-from hatchet_sdk.clients.rest.models.log_line_order_by_direction import (
-    LogLineOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.log_line_order_by_field import LogLineOrderByField
-from hatchet_sdk.clients.rest.models.pagination_response import PaginationResponse
-from hatchet_sdk.clients.rest.models.pull_request import PullRequest
-from hatchet_sdk.clients.rest.models.pull_request_state import PullRequestState
-from hatchet_sdk.clients.rest.models.queue_metrics import QueueMetrics
-from hatchet_sdk.clients.rest.models.rate_limit import RateLimit
-from hatchet_sdk.clients.rest.models.rate_limit_list import RateLimitList
-from hatchet_sdk.clients.rest.models.rate_limit_order_by_direction import (
-    RateLimitOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.rate_limit_order_by_field import (
-    RateLimitOrderByField,
-)
-from hatchet_sdk.clients.rest.models.recent_step_runs import RecentStepRuns
-from hatchet_sdk.clients.rest.models.reject_invite_request import RejectInviteRequest
-from hatchet_sdk.clients.rest.models.replay_event_request import ReplayEventRequest
-from hatchet_sdk.clients.rest.models.replay_workflow_runs_request import (
-    ReplayWorkflowRunsRequest,
-)
-from hatchet_sdk.clients.rest.models.replay_workflow_runs_response import (
-    ReplayWorkflowRunsResponse,
-)
-from hatchet_sdk.clients.rest.models.rerun_step_run_request import RerunStepRunRequest
-from hatchet_sdk.clients.rest.models.schedule_workflow_run_request import (
-    ScheduleWorkflowRunRequest,
-)
-from hatchet_sdk.clients.rest.models.scheduled_run_status import ScheduledRunStatus
-from hatchet_sdk.clients.rest.models.scheduled_workflows import ScheduledWorkflows
-from hatchet_sdk.clients.rest.models.scheduled_workflows_list import (
-    ScheduledWorkflowsList,
-)
-from hatchet_sdk.clients.rest.models.scheduled_workflows_method import (
-    ScheduledWorkflowsMethod,
-)
-from hatchet_sdk.clients.rest.models.scheduled_workflows_order_by_field import (
-    ScheduledWorkflowsOrderByField,
-)
-from hatchet_sdk.clients.rest.models.semaphore_slots import SemaphoreSlots
-from hatchet_sdk.clients.rest.models.slack_webhook import SlackWebhook
-from hatchet_sdk.clients.rest.models.sns_integration import SNSIntegration
-from hatchet_sdk.clients.rest.models.step import Step
-from hatchet_sdk.clients.rest.models.step_run import StepRun
-from hatchet_sdk.clients.rest.models.step_run_archive import StepRunArchive
-from hatchet_sdk.clients.rest.models.step_run_archive_list import StepRunArchiveList
-from hatchet_sdk.clients.rest.models.step_run_diff import StepRunDiff
-from hatchet_sdk.clients.rest.models.step_run_event import StepRunEvent
-from hatchet_sdk.clients.rest.models.step_run_event_list import StepRunEventList
-from hatchet_sdk.clients.rest.models.step_run_event_reason import StepRunEventReason
-from hatchet_sdk.clients.rest.models.step_run_event_severity import StepRunEventSeverity
-from hatchet_sdk.clients.rest.models.step_run_status import StepRunStatus
-from hatchet_sdk.clients.rest.models.tenant import Tenant
-from hatchet_sdk.clients.rest.models.tenant_alert_email_group import (
-    TenantAlertEmailGroup,
-)
-from hatchet_sdk.clients.rest.models.tenant_alert_email_group_list import (
-    TenantAlertEmailGroupList,
-)
-from hatchet_sdk.clients.rest.models.tenant_alerting_settings import (
-    TenantAlertingSettings,
-)
-from hatchet_sdk.clients.rest.models.tenant_invite import TenantInvite
-from hatchet_sdk.clients.rest.models.tenant_invite_list import TenantInviteList
-from hatchet_sdk.clients.rest.models.tenant_list import TenantList
-from hatchet_sdk.clients.rest.models.tenant_member import TenantMember
-from hatchet_sdk.clients.rest.models.tenant_member_list import TenantMemberList
-from hatchet_sdk.clients.rest.models.tenant_member_role import TenantMemberRole
-from hatchet_sdk.clients.rest.models.tenant_queue_metrics import TenantQueueMetrics
-from hatchet_sdk.clients.rest.models.tenant_resource import TenantResource
-from hatchet_sdk.clients.rest.models.tenant_resource_limit import TenantResourceLimit
-from hatchet_sdk.clients.rest.models.tenant_resource_policy import TenantResourcePolicy
-from hatchet_sdk.clients.rest.models.tenant_step_run_queue_metrics import (
-    TenantStepRunQueueMetrics,
-)
-from hatchet_sdk.clients.rest.models.trigger_workflow_run_request import (
-    TriggerWorkflowRunRequest,
-)
-from hatchet_sdk.clients.rest.models.update_tenant_alert_email_group_request import (
-    UpdateTenantAlertEmailGroupRequest,
-)
-from hatchet_sdk.clients.rest.models.update_tenant_invite_request import (
-    UpdateTenantInviteRequest,
-)
-from hatchet_sdk.clients.rest.models.update_tenant_request import UpdateTenantRequest
-from hatchet_sdk.clients.rest.models.update_worker_request import UpdateWorkerRequest
-from hatchet_sdk.clients.rest.models.user import User
-from hatchet_sdk.clients.rest.models.user_change_password_request import (
-    UserChangePasswordRequest,
-)
-from hatchet_sdk.clients.rest.models.user_login_request import UserLoginRequest
-from hatchet_sdk.clients.rest.models.user_register_request import UserRegisterRequest
-from hatchet_sdk.clients.rest.models.user_tenant_memberships_list import (
-    UserTenantMembershipsList,
-)
-from hatchet_sdk.clients.rest.models.user_tenant_public import UserTenantPublic
-from hatchet_sdk.clients.rest.models.webhook_worker import WebhookWorker
-from hatchet_sdk.clients.rest.models.webhook_worker_create_request import (
-    WebhookWorkerCreateRequest,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_create_response import (
-    WebhookWorkerCreateResponse,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_created import WebhookWorkerCreated
-from hatchet_sdk.clients.rest.models.webhook_worker_list_response import (
-    WebhookWorkerListResponse,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_request import WebhookWorkerRequest
-from hatchet_sdk.clients.rest.models.webhook_worker_request_list_response import (
-    WebhookWorkerRequestListResponse,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_request_method import (
-    WebhookWorkerRequestMethod,
-)
-from hatchet_sdk.clients.rest.models.worker import Worker
-from hatchet_sdk.clients.rest.models.worker_label import WorkerLabel
-from hatchet_sdk.clients.rest.models.worker_list import WorkerList
-from hatchet_sdk.clients.rest.models.worker_runtime_info import WorkerRuntimeInfo
-from hatchet_sdk.clients.rest.models.worker_runtime_sdks import WorkerRuntimeSDKs
-from hatchet_sdk.clients.rest.models.worker_type import WorkerType
-from hatchet_sdk.clients.rest.models.workflow import Workflow
-from hatchet_sdk.clients.rest.models.workflow_concurrency import WorkflowConcurrency
-from hatchet_sdk.clients.rest.models.workflow_kind import WorkflowKind
-from hatchet_sdk.clients.rest.models.workflow_list import WorkflowList
-from hatchet_sdk.clients.rest.models.workflow_metrics import WorkflowMetrics
-from hatchet_sdk.clients.rest.models.workflow_run import WorkflowRun
-from hatchet_sdk.clients.rest.models.workflow_run_list import WorkflowRunList
-from hatchet_sdk.clients.rest.models.workflow_run_order_by_direction import (
-    WorkflowRunOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.workflow_run_order_by_field import (
-    WorkflowRunOrderByField,
-)
-from hatchet_sdk.clients.rest.models.workflow_run_shape import WorkflowRunShape
-from hatchet_sdk.clients.rest.models.workflow_run_status import WorkflowRunStatus
-from hatchet_sdk.clients.rest.models.workflow_run_triggered_by import (
-    WorkflowRunTriggeredBy,
-)
-from hatchet_sdk.clients.rest.models.workflow_runs_cancel_request import (
-    WorkflowRunsCancelRequest,
-)
-from hatchet_sdk.clients.rest.models.workflow_runs_metrics import WorkflowRunsMetrics
-from hatchet_sdk.clients.rest.models.workflow_runs_metrics_counts import (
-    WorkflowRunsMetricsCounts,
-)
-from hatchet_sdk.clients.rest.models.workflow_tag import WorkflowTag
-from hatchet_sdk.clients.rest.models.workflow_trigger_cron_ref import (
-    WorkflowTriggerCronRef,
-)
-from hatchet_sdk.clients.rest.models.workflow_trigger_event_ref import (
-    WorkflowTriggerEventRef,
-)
-from hatchet_sdk.clients.rest.models.workflow_triggers import WorkflowTriggers
-from hatchet_sdk.clients.rest.models.workflow_update_request import (
-    WorkflowUpdateRequest,
-)
-from hatchet_sdk.clients.rest.models.workflow_version import WorkflowVersion
-from hatchet_sdk.clients.rest.models.workflow_version_definition import (
-    WorkflowVersionDefinition,
-)
-from hatchet_sdk.clients.rest.models.workflow_version_meta import WorkflowVersionMeta
-from hatchet_sdk.clients.rest.models.workflow_workers_count import WorkflowWorkersCount
+
+# apis and models are resolved lazily through their packages, see the models
+# package's __init__
+def __getattr__(name: str) -> Any:
+    if name in api._LAZY:
+        return getattr(api, name)
+
+    if name in models._LAZY:
+        return getattr(models, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(api._LAZY) | set(models._LAZY))
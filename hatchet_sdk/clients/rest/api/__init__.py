@@ -1,19 +1,60 @@
 # flake8: noqa
 
-# import apis into api package
-from hatchet_sdk.clients.rest.api.api_token_api import APITokenApi
-from hatchet_sdk.clients.rest.api.default_api import DefaultApi
-from hatchet_sdk.clients.rest.api.event_api import EventApi
-from hatchet_sdk.clients.rest.api.github_api import GithubApi
-from hatchet_sdk.clients.rest.api.healthcheck_api import HealthcheckApi
-from hatchet_sdk.clients.rest.api.log_api import LogApi
-from hatchet_sdk.clients.rest.api.metadata_api import MetadataApi
-from hatchet_sdk.clients.rest.api.rate_limits_api import RateLimitsApi
-from hatchet_sdk.clients.rest.api.slack_api import SlackApi
-from hatchet_sdk.clients.rest.api.sns_api import SNSApi
-from hatchet_sdk.clients.rest.api.step_run_api import StepRunApi
-from hatchet_sdk.clients.rest.api.tenant_api import TenantApi
-from hatchet_sdk.clients.rest.api.user_api import UserApi
-from hatchet_sdk.clients.rest.api.worker_api import WorkerApi
-from hatchet_sdk.clients.rest.api.workflow_api import WorkflowApi
-from hatchet_sdk.clients.rest.api.workflow_run_api import WorkflowRunApi
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hatchet_sdk.clients.rest.api.api_token_api import APITokenApi
+    from hatchet_sdk.clients.rest.api.default_api import DefaultApi
+    from hatchet_sdk.clients.rest.api.event_api import EventApi
+    from hatchet_sdk.clients.rest.api.github_api import GithubApi
+    from hatchet_sdk.clients.rest.api.healthcheck_api import HealthcheckApi
+    from hatchet_sdk.clients.rest.api.log_api import LogApi
+    from hatchet_sdk.clients.rest.api.metadata_api import MetadataApi
+    from hatchet_sdk.clients.rest.api.rate_limits_api import RateLimitsApi
+    from hatchet_sdk.clients.rest.api.slack_api import SlackApi
+    from hatchet_sdk.clients.rest.api.sns_api import SNSApi
+    from hatchet_sdk.clients.rest.api.step_run_api import StepRunApi
+    from hatchet_sdk.clients.rest.api.tenant_api import TenantApi
+    from hatchet_sdk.clients.rest.api.user_api import UserApi
+    from hatchet_sdk.clients.rest.api.worker_api import WorkerApi
+    from hatchet_sdk.clients.rest.api.workflow_api import WorkflowApi
+    from hatchet_sdk.clients.rest.api.workflow_run_api import WorkflowRunApi
+
+# api modules are imported on first access, see the models package
+_LAZY = {
+    "APITokenApi": ".api_token_api",
+    "DefaultApi": ".default_api",
+    "EventApi": ".event_api",
+    "GithubApi": ".github_api",
+    "HealthcheckApi": ".healthcheck_api",
+    "LogApi": ".log_api",
+    "MetadataApi": ".metadata_api",
+    "RateLimitsApi": ".rate_limits_api",
+    "SlackApi": ".slack_api",
+    "SNSApi": ".sns_api",
+    "StepRunApi": ".step_run_api",
+    "TenantApi": ".tenant_api",
+    "UserApi": ".user_api",
+    "WorkerApi": ".worker_api",
+    "WorkflowApi": ".workflow_api",
+    "WorkflowRunApi": ".workflow_run_api",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -13,248 +13,454 @@
 """  # noqa: E501
 
 
-from hatchet_sdk.clients.rest.models.accept_invite_request import AcceptInviteRequest
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# import models into model package
-from hatchet_sdk.clients.rest.models.api_error import APIError
-from hatchet_sdk.clients.rest.models.api_errors import APIErrors
-from hatchet_sdk.clients.rest.models.api_meta import APIMeta
-from hatchet_sdk.clients.rest.models.api_meta_auth import APIMetaAuth
-from hatchet_sdk.clients.rest.models.api_meta_integration import APIMetaIntegration
-from hatchet_sdk.clients.rest.models.api_meta_posthog import APIMetaPosthog
-from hatchet_sdk.clients.rest.models.api_resource_meta import APIResourceMeta
-from hatchet_sdk.clients.rest.models.api_token import APIToken
-from hatchet_sdk.clients.rest.models.bulk_create_event_request import (
-    BulkCreateEventRequest,
-)
-from hatchet_sdk.clients.rest.models.cancel_event_request import CancelEventRequest
-from hatchet_sdk.clients.rest.models.concurrency_limit_strategy import (
-    ConcurrencyLimitStrategy,
-)
-from hatchet_sdk.clients.rest.models.create_api_token_request import (
-    CreateAPITokenRequest,
-)
-from hatchet_sdk.clients.rest.models.create_api_token_response import (
-    CreateAPITokenResponse,
-)
-from hatchet_sdk.clients.rest.models.create_cron_workflow_trigger_request import (
-    CreateCronWorkflowTriggerRequest,
-)
-from hatchet_sdk.clients.rest.models.create_event_request import CreateEventRequest
-from hatchet_sdk.clients.rest.models.create_pull_request_from_step_run import (
-    CreatePullRequestFromStepRun,
-)
-from hatchet_sdk.clients.rest.models.create_sns_integration_request import (
-    CreateSNSIntegrationRequest,
-)
-from hatchet_sdk.clients.rest.models.create_tenant_alert_email_group_request import (
-    CreateTenantAlertEmailGroupRequest,
-)
-from hatchet_sdk.clients.rest.models.create_tenant_invite_request import (
-    CreateTenantInviteRequest,
-)
-from hatchet_sdk.clients.rest.models.create_tenant_request import CreateTenantRequest
-from hatchet_sdk.clients.rest.models.cron_workflows import CronWorkflows
-from hatchet_sdk.clients.rest.models.cron_workflows_list import CronWorkflowsList
-from hatchet_sdk.clients.rest.models.cron_workflows_method import CronWorkflowsMethod
-from hatchet_sdk.clients.rest.models.cron_workflows_order_by_field import (
-    CronWorkflowsOrderByField,
-)
-from hatchet_sdk.clients.rest.models.event import Event
-from hatchet_sdk.clients.rest.models.event_data import EventData
-from hatchet_sdk.clients.rest.models.event_key_list import EventKeyList
-from hatchet_sdk.clients.rest.models.event_list import EventList
-from hatchet_sdk.clients.rest.models.event_order_by_direction import (
-    EventOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.event_order_by_field import EventOrderByField
-from hatchet_sdk.clients.rest.models.event_update_cancel200_response import (
-    EventUpdateCancel200Response,
-)
-from hatchet_sdk.clients.rest.models.event_workflow_run_summary import (
-    EventWorkflowRunSummary,
-)
-from hatchet_sdk.clients.rest.models.events import Events
-from hatchet_sdk.clients.rest.models.get_step_run_diff_response import (
-    GetStepRunDiffResponse,
-)
-from hatchet_sdk.clients.rest.models.info_get_version200_response import (
-    InfoGetVersion200Response,
-)
-from hatchet_sdk.clients.rest.models.job import Job
-from hatchet_sdk.clients.rest.models.job_run import JobRun
-from hatchet_sdk.clients.rest.models.job_run_status import JobRunStatus
-from hatchet_sdk.clients.rest.models.list_api_tokens_response import (
-    ListAPITokensResponse,
-)
-from hatchet_sdk.clients.rest.models.list_pull_requests_response import (
-    ListPullRequestsResponse,
-)
-from hatchet_sdk.clients.rest.models.list_slack_webhooks import ListSlackWebhooks
-from hatchet_sdk.clients.rest.models.list_sns_integrations import ListSNSIntegrations
-from hatchet_sdk.clients.rest.models.log_line import LogLine
-from hatchet_sdk.clients.rest.models.log_line_level import LogLineLevel
-from hatchet_sdk.clients.rest.models.log_line_list import LogLineList
-from hatchet_sdk.clients.rest.models.log_line_order_by_direction import (
-    LogLineOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.log_line_order_by_field import LogLineOrderByField
-from hatchet_sdk.clients.rest.models.pagination_response import PaginationResponse
-from hatchet_sdk.clients.rest.models.pull_request import PullRequest
-from hatchet_sdk.clients.rest.models.pull_request_state import PullRequestState
-from hatchet_sdk.clients.rest.models.queue_metrics import QueueMetrics
-from hatchet_sdk.clients.rest.models.rate_limit import RateLimit
-from hatchet_sdk.clients.rest.models.rate_limit_list import RateLimitList
-from hatchet_sdk.clients.rest.models.rate_limit_order_by_direction import (
-    RateLimitOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.rate_limit_order_by_field import (
-    RateLimitOrderByField,
-)
-from hatchet_sdk.clients.rest.models.recent_step_runs import RecentStepRuns
-from hatchet_sdk.clients.rest.models.reject_invite_request import RejectInviteRequest
-from hatchet_sdk.clients.rest.models.replay_event_request import ReplayEventRequest
-from hatchet_sdk.clients.rest.models.replay_workflow_runs_request import (
-    ReplayWorkflowRunsRequest,
-)
-from hatchet_sdk.clients.rest.models.replay_workflow_runs_response import (
-    ReplayWorkflowRunsResponse,
-)
-from hatchet_sdk.clients.rest.models.rerun_step_run_request import RerunStepRunRequest
-from hatchet_sdk.clients.rest.models.schedule_workflow_run_request import (
-    ScheduleWorkflowRunRequest,
-)
-from hatchet_sdk.clients.rest.models.scheduled_run_status import ScheduledRunStatus
-from hatchet_sdk.clients.rest.models.scheduled_workflows import ScheduledWorkflows
-from hatchet_sdk.clients.rest.models.scheduled_workflows_list import (
-    ScheduledWorkflowsList,
-)
-from hatchet_sdk.clients.rest.models.scheduled_workflows_method import (
-    ScheduledWorkflowsMethod,
-)
-from hatchet_sdk.clients.rest.models.scheduled_workflows_order_by_field import (
-    ScheduledWorkflowsOrderByField,
-)
-from hatchet_sdk.clients.rest.models.semaphore_slots import SemaphoreSlots
-from hatchet_sdk.clients.rest.models.slack_webhook import SlackWebhook
-from hatchet_sdk.clients.rest.models.sns_integration import SNSIntegration
-from hatchet_sdk.clients.rest.models.step import Step
-from hatchet_sdk.clients.rest.models.step_run import StepRun
-from hatchet_sdk.clients.rest.models.step_run_archive import StepRunArchive
-from hatchet_sdk.clients.rest.models.step_run_archive_list import StepRunArchiveList
-from hatchet_sdk.clients.rest.models.step_run_diff import StepRunDiff
-from hatchet_sdk.clients.rest.models.step_run_event import StepRunEvent
-from hatchet_sdk.clients.rest.models.step_run_event_list import StepRunEventList
-from hatchet_sdk.clients.rest.models.step_run_event_reason import StepRunEventReason
-from hatchet_sdk.clients.rest.models.step_run_event_severity import StepRunEventSeverity
-from hatchet_sdk.clients.rest.models.step_run_status import StepRunStatus
-from hatchet_sdk.clients.rest.models.tenant import Tenant
-from hatchet_sdk.clients.rest.models.tenant_alert_email_group import (
-    TenantAlertEmailGroup,
-)
-from hatchet_sdk.clients.rest.models.tenant_alert_email_group_list import (
-    TenantAlertEmailGroupList,
-)
-from hatchet_sdk.clients.rest.models.tenant_alerting_settings import (
-    TenantAlertingSettings,
-)
-from hatchet_sdk.clients.rest.models.tenant_invite import TenantInvite
-from hatchet_sdk.clients.rest.models.tenant_invite_list import TenantInviteList
-from hatchet_sdk.clients.rest.models.tenant_list import TenantList
-from hatchet_sdk.clients.rest.models.tenant_member import TenantMember
-from hatchet_sdk.clients.rest.models.tenant_member_list import TenantMemberList
-from hatchet_sdk.clients.rest.models.tenant_member_role import TenantMemberRole
-from hatchet_sdk.clients.rest.models.tenant_queue_metrics import TenantQueueMetrics
-from hatchet_sdk.clients.rest.models.tenant_resource import TenantResource
-from hatchet_sdk.clients.rest.models.tenant_resource_limit import TenantResourceLimit
-from hatchet_sdk.clients.rest.models.tenant_resource_policy import TenantResourcePolicy
-from hatchet_sdk.clients.rest.models.tenant_step_run_queue_metrics import (
-    TenantStepRunQueueMetrics,
-)
-from hatchet_sdk.clients.rest.models.trigger_workflow_run_request import (
-    TriggerWorkflowRunRequest,
-)
-from hatchet_sdk.clients.rest.models.update_tenant_alert_email_group_request import (
-    UpdateTenantAlertEmailGroupRequest,
-)
-from hatchet_sdk.clients.rest.models.update_tenant_invite_request import (
-    UpdateTenantInviteRequest,
-)
-from hatchet_sdk.clients.rest.models.update_tenant_request import UpdateTenantRequest
-from hatchet_sdk.clients.rest.models.update_worker_request import UpdateWorkerRequest
-from hatchet_sdk.clients.rest.models.user import User
-from hatchet_sdk.clients.rest.models.user_change_password_request import (
-    UserChangePasswordRequest,
-)
-from hatchet_sdk.clients.rest.models.user_login_request import UserLoginRequest
-from hatchet_sdk.clients.rest.models.user_register_request import UserRegisterRequest
-from hatchet_sdk.clients.rest.models.user_tenant_memberships_list import (
-    UserTenantMembershipsList,
-)
-from hatchet_sdk.clients.rest.models.user_tenant_public import UserTenantPublic
-from hatchet_sdk.clients.rest.models.webhook_worker import WebhookWorker
-from hatchet_sdk.clients.rest.models.webhook_worker_create_request import (
-    WebhookWorkerCreateRequest,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_create_response import (
-    WebhookWorkerCreateResponse,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_created import WebhookWorkerCreated
-from hatchet_sdk.clients.rest.models.webhook_worker_list_response import (
-    WebhookWorkerListResponse,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_request import WebhookWorkerRequest
-from hatchet_sdk.clients.rest.models.webhook_worker_request_list_response import (
-    WebhookWorkerRequestListResponse,
-)
-from hatchet_sdk.clients.rest.models.webhook_worker_request_method import (
-    WebhookWorkerRequestMethod,
-)
-from hatchet_sdk.clients.rest.models.worker import Worker
-from hatchet_sdk.clients.rest.models.worker_label import WorkerLabel
-from hatchet_sdk.clients.rest.models.worker_list import WorkerList
-from hatchet_sdk.clients.rest.models.worker_runtime_info import WorkerRuntimeInfo
-from hatchet_sdk.clients.rest.models.worker_runtime_sdks import WorkerRuntimeSDKs
-from hatchet_sdk.clients.rest.models.worker_type import WorkerType
-from hatchet_sdk.clients.rest.models.workflow import Workflow
-from hatchet_sdk.clients.rest.models.workflow_concurrency import WorkflowConcurrency
-from hatchet_sdk.clients.rest.models.workflow_kind import WorkflowKind
-from hatchet_sdk.clients.rest.models.workflow_list import WorkflowList
-from hatchet_sdk.clients.rest.models.workflow_metrics import WorkflowMetrics
-from hatchet_sdk.clients.rest.models.workflow_run import WorkflowRun
-from hatchet_sdk.clients.rest.models.workflow_run_list import WorkflowRunList
-from hatchet_sdk.clients.rest.models.workflow_run_order_by_direction import (
-    WorkflowRunOrderByDirection,
-)
-from hatchet_sdk.clients.rest.models.workflow_run_order_by_field import (
-    WorkflowRunOrderByField,
-)
-from hatchet_sdk.clients.rest.models.workflow_run_shape import WorkflowRunShape
-from hatchet_sdk.clients.rest.models.workflow_run_status import WorkflowRunStatus
-from hatchet_sdk.clients.rest.models.workflow_run_triggered_by import (
-    WorkflowRunTriggeredBy,
-)
-from hatchet_sdk.clients.rest.models.workflow_runs_cancel_request import (
-    WorkflowRunsCancelRequest,
-)
-from hatchet_sdk.clients.rest.models.workflow_runs_metrics import WorkflowRunsMetrics
-from hatchet_sdk.clients.rest.models.workflow_runs_metrics_counts import (
-    WorkflowRunsMetricsCounts,
-)
-from hatchet_sdk.clients.rest.models.workflow_tag import WorkflowTag
-from hatchet_sdk.clients.rest.models.workflow_trigger_cron_ref import (
-    WorkflowTriggerCronRef,
-)
-from hatchet_sdk.clients.rest.models.workflow_trigger_event_ref import (
-    WorkflowTriggerEventRef,
-)
-from hatchet_sdk.clients.rest.models.workflow_triggers import WorkflowTriggers
-from hatchet_sdk.clients.rest.models.workflow_update_request import (
-    WorkflowUpdateRequest,
-)
-from hatchet_sdk.clients.rest.models.workflow_version import WorkflowVersion
-from hatchet_sdk.clients.rest.models.workflow_version_definition import (
-    WorkflowVersionDefinition,
-)
-from hatchet_sdk.clients.rest.models.workflow_version_meta import WorkflowVersionMeta
-from hatchet_sdk.clients.rest.models.workflow_workers_count import WorkflowWorkersCount
+if TYPE_CHECKING:
+    from hatchet_sdk.clients.rest.models.accept_invite_request import (
+        AcceptInviteRequest,
+    )
+    from hatchet_sdk.clients.rest.models.api_error import APIError
+    from hatchet_sdk.clients.rest.models.api_errors import APIErrors
+    from hatchet_sdk.clients.rest.models.api_meta import APIMeta
+    from hatchet_sdk.clients.rest.models.api_meta_auth import APIMetaAuth
+    from hatchet_sdk.clients.rest.models.api_meta_integration import APIMetaIntegration
+    from hatchet_sdk.clients.rest.models.api_meta_posthog import APIMetaPosthog
+    from hatchet_sdk.clients.rest.models.api_resource_meta import APIResourceMeta
+    from hatchet_sdk.clients.rest.models.api_token import APIToken
+    from hatchet_sdk.clients.rest.models.bulk_create_event_request import (
+        BulkCreateEventRequest,
+    )
+    from hatchet_sdk.clients.rest.models.cancel_event_request import CancelEventRequest
+    from hatchet_sdk.clients.rest.models.concurrency_limit_strategy import (
+        ConcurrencyLimitStrategy,
+    )
+    from hatchet_sdk.clients.rest.models.create_api_token_request import (
+        CreateAPITokenRequest,
+    )
+    from hatchet_sdk.clients.rest.models.create_api_token_response import (
+        CreateAPITokenResponse,
+    )
+    from hatchet_sdk.clients.rest.models.create_cron_workflow_trigger_request import (
+        CreateCronWorkflowTriggerRequest,
+    )
+    from hatchet_sdk.clients.rest.models.create_event_request import CreateEventRequest
+    from hatchet_sdk.clients.rest.models.create_pull_request_from_step_run import (
+        CreatePullRequestFromStepRun,
+    )
+    from hatchet_sdk.clients.rest.models.create_sns_integration_request import (
+        CreateSNSIntegrationRequest,
+    )
+    from hatchet_sdk.clients.rest.models.create_tenant_alert_email_group_request import (
+        CreateTenantAlertEmailGroupRequest,
+    )
+    from hatchet_sdk.clients.rest.models.create_tenant_invite_request import (
+        CreateTenantInviteRequest,
+    )
+    from hatchet_sdk.clients.rest.models.create_tenant_request import (
+        CreateTenantRequest,
+    )
+    from hatchet_sdk.clients.rest.models.cron_workflows import CronWorkflows
+    from hatchet_sdk.clients.rest.models.cron_workflows_list import CronWorkflowsList
+    from hatchet_sdk.clients.rest.models.cron_workflows_method import (
+        CronWorkflowsMethod,
+    )
+    from hatchet_sdk.clients.rest.models.cron_workflows_order_by_field import (
+        CronWorkflowsOrderByField,
+    )
+    from hatchet_sdk.clients.rest.models.event import Event
+    from hatchet_sdk.clients.rest.models.event_data import EventData
+    from hatchet_sdk.clients.rest.models.event_key_list import EventKeyList
+    from hatchet_sdk.clients.rest.models.event_list import EventList
+    from hatchet_sdk.clients.rest.models.event_order_by_direction import (
+        EventOrderByDirection,
+    )
+    from hatchet_sdk.clients.rest.models.event_order_by_field import EventOrderByField
+    from hatchet_sdk.clients.rest.models.event_update_cancel200_response import (
+        EventUpdateCancel200Response,
+    )
+    from hatchet_sdk.clients.rest.models.event_workflow_run_summary import (
+        EventWorkflowRunSummary,
+    )
+    from hatchet_sdk.clients.rest.models.events import Events
+    from hatchet_sdk.clients.rest.models.get_step_run_diff_response import (
+        GetStepRunDiffResponse,
+    )
+    from hatchet_sdk.clients.rest.models.info_get_version200_response import (
+        InfoGetVersion200Response,
+    )
+    from hatchet_sdk.clients.rest.models.job import Job
+    from hatchet_sdk.clients.rest.models.job_run import JobRun
+    from hatchet_sdk.clients.rest.models.job_run_status import JobRunStatus
+    from hatchet_sdk.clients.rest.models.list_api_tokens_response import (
+        ListAPITokensResponse,
+    )
+    from hatchet_sdk.clients.rest.models.list_pull_requests_response import (
+        ListPullRequestsResponse,
+    )
+    from hatchet_sdk.clients.rest.models.list_slack_webhooks import ListSlackWebhooks
+    from hatchet_sdk.clients.rest.models.list_sns_integrations import (
+        ListSNSIntegrations,
+    )
+    from hatchet_sdk.clients.rest.models.log_line import LogLine
+    from hatchet_sdk.clients.rest.models.log_line_level import LogLineLevel
+    from hatchet_sdk.clients.rest.models.log_line_list import LogLineList
+    from hatchet_sdk.clients.rest.models.log_line_order_by_direction import (
+        LogLineOrderByDirection,
+    )
+    from hatchet_sdk.clients.rest.models.log_line_order_by_field import (
+        LogLineOrderByField,
+    )
+    from hatchet_sdk.clients.rest.models.pagination_response import PaginationResponse
+    from hatchet_sdk.clients.rest.models.pull_request import PullRequest
+    from hatchet_sdk.clients.rest.models.pull_request_state import PullRequestState
+    from hatchet_sdk.clients.rest.models.queue_metrics import QueueMetrics
+    from hatchet_sdk.clients.rest.models.rate_limit import RateLimit
+    from hatchet_sdk.clients.rest.models.rate_limit_list import RateLimitList
+    from hatchet_sdk.clients.rest.models.rate_limit_order_by_direction import (
+        RateLimitOrderByDirection,
+    )
+    from hatchet_sdk.clients.rest.models.rate_limit_order_by_field import (
+        RateLimitOrderByField,
+    )
+    from hatchet_sdk.clients.rest.models.recent_step_runs import RecentStepRuns
+    from hatchet_sdk.clients.rest.models.reject_invite_request import (
+        RejectInviteRequest,
+    )
+    from hatchet_sdk.clients.rest.models.replay_event_request import ReplayEventRequest
+    from hatchet_sdk.clients.rest.models.replay_workflow_runs_request import (
+        ReplayWorkflowRunsRequest,
+    )
+    from hatchet_sdk.clients.rest.models.replay_workflow_runs_response import (
+        ReplayWorkflowRunsResponse,
+    )
+    from hatchet_sdk.clients.rest.models.rerun_step_run_request import (
+        RerunStepRunRequest,
+    )
+    from hatchet_sdk.clients.rest.models.schedule_workflow_run_request import (
+        ScheduleWorkflowRunRequest,
+    )
+    from hatchet_sdk.clients.rest.models.scheduled_run_status import ScheduledRunStatus
+    from hatchet_sdk.clients.rest.models.scheduled_workflows import ScheduledWorkflows
+    from hatchet_sdk.clients.rest.models.scheduled_workflows_list import (
+        ScheduledWorkflowsList,
+    )
+    from hatchet_sdk.clients.rest.models.scheduled_workflows_method import (
+        ScheduledWorkflowsMethod,
+    )
+    from hatchet_sdk.clients.rest.models.scheduled_workflows_order_by_field import (
+        ScheduledWorkflowsOrderByField,
+    )
+    from hatchet_sdk.clients.rest.models.semaphore_slots import SemaphoreSlots
+    from hatchet_sdk.clients.rest.models.slack_webhook import SlackWebhook
+    from hatchet_sdk.clients.rest.models.sns_integration import SNSIntegration
+    from hatchet_sdk.clients.rest.models.step import Step
+    from hatchet_sdk.clients.rest.models.step_run import StepRun
+    from hatchet_sdk.clients.rest.models.step_run_archive import StepRunArchive
+    from hatchet_sdk.clients.rest.models.step_run_archive_list import StepRunArchiveList
+    from hatchet_sdk.clients.rest.models.step_run_diff import StepRunDiff
+    from hatchet_sdk.clients.rest.models.step_run_event import StepRunEvent
+    from hatchet_sdk.clients.rest.models.step_run_event_list import StepRunEventList
+    from hatchet_sdk.clients.rest.models.step_run_event_reason import StepRunEventReason
+    from hatchet_sdk.clients.rest.models.step_run_event_severity import (
+        StepRunEventSeverity,
+    )
+    from hatchet_sdk.clients.rest.models.step_run_status import StepRunStatus
+    from hatchet_sdk.clients.rest.models.tenant import Tenant
+    from hatchet_sdk.clients.rest.models.tenant_alert_email_group import (
+        TenantAlertEmailGroup,
+    )
+    from hatchet_sdk.clients.rest.models.tenant_alert_email_group_list import (
+        TenantAlertEmailGroupList,
+    )
+    from hatchet_sdk.clients.rest.models.tenant_alerting_settings import (
+        TenantAlertingSettings,
+    )
+    from hatchet_sdk.clients.rest.models.tenant_invite import TenantInvite
+    from hatchet_sdk.clients.rest.models.tenant_invite_list import TenantInviteList
+    from hatchet_sdk.clients.rest.models.tenant_list import TenantList
+    from hatchet_sdk.clients.rest.models.tenant_member import TenantMember
+    from hatchet_sdk.clients.rest.models.tenant_member_list import TenantMemberList
+    from hatchet_sdk.clients.rest.models.tenant_member_role import TenantMemberRole
+    from hatchet_sdk.clients.rest.models.tenant_queue_metrics import TenantQueueMetrics
+    from hatchet_sdk.clients.rest.models.tenant_resource import TenantResource
+    from hatchet_sdk.clients.rest.models.tenant_resource_limit import (
+        TenantResourceLimit,
+    )
+    from hatchet_sdk.clients.rest.models.tenant_resource_policy import (
+        TenantResourcePolicy,
+    )
+    from hatchet_sdk.clients.rest.models.tenant_step_run_queue_metrics import (
+        TenantStepRunQueueMetrics,
+    )
+    from hatchet_sdk.clients.rest.models.trigger_workflow_run_request import (
+        TriggerWorkflowRunRequest,
+    )
+    from hatchet_sdk.clients.rest.models.update_tenant_alert_email_group_request import (
+        UpdateTenantAlertEmailGroupRequest,
+    )
+    from hatchet_sdk.clients.rest.models.update_tenant_invite_request import (
+        UpdateTenantInviteRequest,
+    )
+    from hatchet_sdk.clients.rest.models.update_tenant_request import (
+        UpdateTenantRequest,
+    )
+    from hatchet_sdk.clients.rest.models.update_worker_request import (
+        UpdateWorkerRequest,
+    )
+    from hatchet_sdk.clients.rest.models.user import User
+    from hatchet_sdk.clients.rest.models.user_change_password_request import (
+        UserChangePasswordRequest,
+    )
+    from hatchet_sdk.clients.rest.models.user_login_request import UserLoginRequest
+    from hatchet_sdk.clients.rest.models.user_register_request import (
+        UserRegisterRequest,
+    )
+    from hatchet_sdk.clients.rest.models.user_tenant_memberships_list import (
+        UserTenantMembershipsList,
+    )
+    from hatchet_sdk.clients.rest.models.user_tenant_public import UserTenantPublic
+    from hatchet_sdk.clients.rest.models.webhook_worker import WebhookWorker
+    from hatchet_sdk.clients.rest.models.webhook_worker_create_request import (
+        WebhookWorkerCreateRequest,
+    )
+    from hatchet_sdk.clients.rest.models.webhook_worker_create_response import (
+        WebhookWorkerCreateResponse,
+    )
+    from hatchet_sdk.clients.rest.models.webhook_worker_created import (
+        WebhookWorkerCreated,
+    )
+    from hatchet_sdk.clients.rest.models.webhook_worker_list_response import (
+        WebhookWorkerListResponse,
+    )
+    from hatchet_sdk.clients.rest.models.webhook_worker_request import (
+        WebhookWorkerRequest,
+    )
+    from hatchet_sdk.clients.rest.models.webhook_worker_request_list_response import (
+        WebhookWorkerRequestListResponse,
+    )
+    from hatchet_sdk.clients.rest.models.webhook_worker_request_method import (
+        WebhookWorkerRequestMethod,
+    )
+    from hatchet_sdk.clients.rest.models.worker import Worker
+    from hatchet_sdk.clients.rest.models.worker_label import WorkerLabel
+    from hatchet_sdk.clients.rest.models.worker_list import WorkerList
+    from hatchet_sdk.clients.rest.models.worker_runtime_info import WorkerRuntimeInfo
+    from hatchet_sdk.clients.rest.models.worker_runtime_sdks import WorkerRuntimeSDKs
+    from hatchet_sdk.clients.rest.models.worker_type import WorkerType
+    from hatchet_sdk.clients.rest.models.workflow import Workflow
+    from hatchet_sdk.clients.rest.models.workflow_concurrency import WorkflowConcurrency
+    from hatchet_sdk.clients.rest.models.workflow_kind import WorkflowKind
+    from hatchet_sdk.clients.rest.models.workflow_list import WorkflowList
+    from hatchet_sdk.clients.rest.models.workflow_metrics import WorkflowMetrics
+    from hatchet_sdk.clients.rest.models.workflow_run import WorkflowRun
+    from hatchet_sdk.clients.rest.models.workflow_run_list import WorkflowRunList
+    from hatchet_sdk.clients.rest.models.workflow_run_order_by_direction import (
+        WorkflowRunOrderByDirection,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_run_order_by_field import (
+        WorkflowRunOrderByField,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_run_shape import WorkflowRunShape
+    from hatchet_sdk.clients.rest.models.workflow_run_status import WorkflowRunStatus
+    from hatchet_sdk.clients.rest.models.workflow_run_triggered_by import (
+        WorkflowRunTriggeredBy,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_runs_cancel_request import (
+        WorkflowRunsCancelRequest,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_runs_metrics import (
+        WorkflowRunsMetrics,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_runs_metrics_counts import (
+        WorkflowRunsMetricsCounts,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_tag import WorkflowTag
+    from hatchet_sdk.clients.rest.models.workflow_trigger_cron_ref import (
+        WorkflowTriggerCronRef,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_trigger_event_ref import (
+        WorkflowTriggerEventRef,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_triggers import WorkflowTriggers
+    from hatchet_sdk.clients.rest.models.workflow_update_request import (
+        WorkflowUpdateRequest,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_version import WorkflowVersion
+    from hatchet_sdk.clients.rest.models.workflow_version_definition import (
+        WorkflowVersionDefinition,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_version_meta import (
+        WorkflowVersionMeta,
+    )
+    from hatchet_sdk.clients.rest.models.workflow_workers_count import (
+        WorkflowWorkersCount,
+    )
+
+# model modules are imported on first access, since building every pydantic
+# model up front dominates the import time of the sdk
+_LAZY = {
+    "AcceptInviteRequest": ".accept_invite_request",
+    "APIError": ".api_error",
+    "APIErrors": ".api_errors",
+    "APIMeta": ".api_meta",
+    "APIMetaAuth": ".api_meta_auth",
+    "APIMetaIntegration": ".api_meta_integration",
+    "APIMetaPosthog": ".api_meta_posthog",
+    "APIResourceMeta": ".api_resource_meta",
+    "APIToken": ".api_token",
+    "BulkCreateEventRequest": ".bulk_create_event_request",
+    "CancelEventRequest": ".cancel_event_request",
+    "ConcurrencyLimitStrategy": ".concurrency_limit_strategy",
+    "CreateAPITokenRequest": ".create_api_token_request",
+    "CreateAPITokenResponse": ".create_api_token_response",
+    "CreateCronWorkflowTriggerRequest": ".create_cron_workflow_trigger_request",
+    "CreateEventRequest": ".create_event_request",
+    "CreatePullRequestFromStepRun": ".create_pull_request_from_step_run",
+    "CreateSNSIntegrationRequest": ".create_sns_integration_request",
+    "CreateTenantAlertEmailGroupRequest": ".create_tenant_alert_email_group_request",
+    "CreateTenantInviteRequest": ".create_tenant_invite_request",
+    "CreateTenantRequest": ".create_tenant_request",
+    "CronWorkflows": ".cron_workflows",
+    "CronWorkflowsList": ".cron_workflows_list",
+    "CronWorkflowsMethod": ".cron_workflows_method",
+    "CronWorkflowsOrderByField": ".cron_workflows_order_by_field",
+    "Event": ".event",
+    "EventData": ".event_data",
+    "EventKeyList": ".event_key_list",
+    "EventList": ".event_list",
+    "EventOrderByDirection": ".event_order_by_direction",
+    "EventOrderByField": ".event_order_by_field",
+    "EventUpdateCancel200Response": ".event_update_cancel200_response",
+    "EventWorkflowRunSummary": ".event_workflow_run_summary",
+    "Events": ".events",
+    "GetStepRunDiffResponse": ".get_step_run_diff_response",
+    "InfoGetVersion200Response": ".info_get_version200_response",
+    "Job": ".job",
+    "JobRun": ".job_run",
+    "JobRunStatus": ".job_run_status",
+    "ListAPITokensResponse": ".list_api_tokens_response",
+    "ListPullRequestsResponse": ".list_pull_requests_response",
+    "ListSlackWebhooks": ".list_slack_webhooks",
+    "ListSNSIntegrations": ".list_sns_integrations",
+    "LogLine": ".log_line",
+    "LogLineLevel": ".log_line_level",
+    "LogLineList": ".log_line_list",
+    "LogLineOrderByDirection": ".log_line_order_by_direction",
+    "LogLineOrderByField": ".log_line_order_by_field",
+    "PaginationResponse": ".pagination_response",
+    "PullRequest": ".pull_request",
+    "PullRequestState": ".pull_request_state",
+    "QueueMetrics": ".queue_metrics",
+    "RateLimit": ".rate_limit",
+    "RateLimitList": ".rate_limit_list",
+    "RateLimitOrderByDirection": ".rate_limit_order_by_direction",
+    "RateLimitOrderByField": ".rate_limit_order_by_field",
+    "RecentStepRuns": ".recent_step_runs",
+    "RejectInviteRequest": ".reject_invite_request",
+    "ReplayEventRequest": ".replay_event_request",
+    "ReplayWorkflowRunsRequest": ".replay_workflow_runs_request",
+    "ReplayWorkflowRunsResponse": ".replay_workflow_runs_response",
+    "RerunStepRunRequest": ".rerun_step_run_request",
+    "ScheduleWorkflowRunRequest": ".schedule_workflow_run_request",
+    "ScheduledRunStatus": ".scheduled_run_status",
+    "ScheduledWorkflows": ".scheduled_workflows",
+    "ScheduledWorkflowsList": ".scheduled_workflows_list",
+    "ScheduledWorkflowsMethod": ".scheduled_workflows_method",
+    "ScheduledWorkflowsOrderByField": ".scheduled_workflows_order_by_field",
+    "SemaphoreSlots": ".semaphore_slots",
+    "SlackWebhook": ".slack_webhook",
+    "SNSIntegration": ".sns_integration",
+    "Step": ".step",
+    "StepRun": ".step_run",
+    "StepRunArchive": ".step_run_archive",
+    "StepRunArchiveList": ".step_run_archive_list",
+    "StepRunDiff": ".step_run_diff",
+    "StepRunEvent": ".step_run_event",
+    "StepRunEventList": ".step_run_event_list",
+    "StepRunEventReason": ".step_run_event_reason",
+    "StepRunEventSeverity": ".step_run_event_severity",
+    "StepRunStatus": ".step_run_status",
+    "Tenant": ".tenant",
+    "TenantAlertEmailGroup": ".tenant_alert_email_group",
+    "TenantAlertEmailGroupList": ".tenant_alert_email_group_list",
+    "TenantAlertingSettings": ".tenant_alerting_settings",
+    "TenantInvite": ".tenant_invite",
+    "TenantInviteList": ".tenant_invite_list",
+    "TenantList": ".tenant_list",
+    "TenantMember": ".tenant_member",
+    "TenantMemberList": ".tenant_member_list",
+    "TenantMemberRole": ".tenant_member_role",
+    "TenantQueueMetrics": ".tenant_queue_metrics",
+    "TenantResource": ".tenant_resource",
+    "TenantResourceLimit": ".tenant_resource_limit",
+    "TenantResourcePolicy": ".tenant_resource_policy",
+    "TenantStepRunQueueMetrics": ".tenant_step_run_queue_metrics",
+    "TriggerWorkflowRunRequest": ".trigger_workflow_run_request",
+    "UpdateTenantAlertEmailGroupRequest": ".update_tenant_alert_email_group_request",
+    "UpdateTenantInviteRequest": ".update_tenant_invite_request",
+    "UpdateTenantRequest": ".update_tenant_request",
+    "UpdateWorkerRequest": ".update_worker_request",
+    "User": ".user",
+    "UserChangePasswordRequest": ".user_change_password_request",
+    "UserLoginRequest": ".user_login_request",
+    "UserRegisterRequest": ".user_register_request",
+    "UserTenantMembershipsList": ".user_tenant_memberships_list",
+    "UserTenantPublic": ".user_tenant_public",
+    "WebhookWorker": ".webhook_worker",
+    "WebhookWorkerCreateRequest": ".webhook_worker_create_request",
+    "WebhookWorkerCreateResponse": ".webhook_worker_create_response",
+    "WebhookWorkerCreated": ".webhook_worker_created",
+    "WebhookWorkerListResponse": ".webhook_worker_list_response",
+    "WebhookWorkerRequest": ".webhook_worker_request",
+    "WebhookWorkerRequestListResponse": ".webhook_worker_request_list_response",
+    "WebhookWorkerRequestMethod": ".webhook_worker_request_method",
+    "Worker": ".worker",
+    "WorkerLabel": ".worker_label",
+    "WorkerList": ".worker_list",
+    "WorkerRuntimeInfo": ".worker_runtime_info",
+    "WorkerRuntimeSDKs": ".worker_runtime_sdks",
+    "WorkerType": ".worker_type",
+    "Workflow": ".workflow",
+    "WorkflowConcurrency": ".workflow_concurrency",
+    "WorkflowKind": ".workflow_kind",
+    "WorkflowList": ".workflow_list",
+    "WorkflowMetrics": ".workflow_metrics",
+    "WorkflowRun": ".workflow_run",
+    "WorkflowRunList": ".workflow_run_list",
+    "WorkflowRunOrderByDirection": ".workflow_run_order_by_direction",
+    "WorkflowRunOrderByField": ".workflow_run_order_by_field",
+    "WorkflowRunShape": ".workflow_run_shape",
+    "WorkflowRunStatus": ".workflow_run_status",
+    "WorkflowRunTriggeredBy": ".workflow_run_triggered_by",
+    "WorkflowRunsCancelRequest": ".workflow_runs_cancel_request",
+    "WorkflowRunsMetrics": ".workflow_runs_metrics",
+    "WorkflowRunsMetricsCounts": ".workflow_runs_metrics_counts",
+    "WorkflowTag": ".workflow_tag",
+    "WorkflowTriggerCronRef": ".workflow_trigger_cron_ref",
+    "WorkflowTriggerEventRef": ".workflow_trigger_event_ref",
+    "WorkflowTriggers": ".workflow_triggers",
+    "WorkflowUpdateRequest": ".workflow_update_request",
+    "WorkflowVersion": ".workflow_version",
+    "WorkflowVersionDefinition": ".workflow_version_definition",
+    "WorkflowVersionMeta": ".workflow_version_meta",
+    "WorkflowWorkersCount": ".workflow_workers_count",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import json
-import pprint
 import re  # noqa: F401
 from typing import Any, ClassVar, Dict, List, Optional, Set
 
@@ -51,12 +50,11 @@ class TenantMember(BaseModel):
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
+        return self.model_dump_json(by_alias=True, indent=2)
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return self.model_dump_json(by_alias=True, exclude_none=True)
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
@@ -80,15 +78,6 @@ class TenantMember(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
-        # override the default output from pydantic by calling `to_dict()` of metadata
-        if self.metadata:
-            _dict["metadata"] = self.metadata.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of user
-        if self.user:
-            _dict["user"] = self.user.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of tenant
-        if self.tenant:
-            _dict["tenant"] = self.tenant.to_dict()
         return _dict
 
     @classmethod
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import TYPE_CHECKING, Literal, cast, overload
 
 import grpc
@@ -7,40 +8,92 @@ if TYPE_CHECKING:
     from hatchet_sdk.loader import ClientConfig
 
 
-@overload
-def new_conn(config: "ClientConfig", aio: Literal[False]) -> grpc.Channel: ...
-
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
 
-@overload
-def new_conn(config: "ClientConfig", aio: Literal[True]) -> grpc.aio.Channel: ...
 
+def _mtime_ns(path: str | None) -> int | None:
+    if path is None:
+        return None
 
-def new_conn(config: "ClientConfig", aio: bool) -> grpc.Channel | grpc.aio.Channel:
-    credentials: grpc.ChannelCredentials | None = None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        # Reading the file reports the error
+        return None
 
-    # load channel credentials
-    if config.tls_config.strategy == "tls":
-        root: bytes | None = None
 
-        if config.tls_config.root_ca_file:
-            root = open(config.tls_config.root_ca_file, "rb").read()
+# Every channel in a pool (and every sync / aio pair) uses the same TLS files, so the certificates
+# are read from disk once per distinct set of paths. The files' modification times are part of the
+# key, so certificates rotated on disk are picked up the next time a channel is created.
+@lru_cache(maxsize=8)
+def _cached_channel_credentials(
+    strategy: str,
+    root_ca_file: str | None,
+    key_file: str | None,
+    cert_file: str | None,
+    mtimes: tuple[int | None, ...],
+) -> grpc.ChannelCredentials | None:
+    if strategy == "tls":
+        root = _read_file(root_ca_file) if root_ca_file else None
 
-        credentials = grpc.ssl_channel_credentials(root_certificates=root)
-    elif config.tls_config.strategy == "mtls":
-        assert config.tls_config.root_ca_file
-        assert config.tls_config.key_file
-        assert config.tls_config.cert_file
+        return grpc.ssl_channel_credentials(root_certificates=root)
 
-        root = open(config.tls_config.root_ca_file, "rb").read()
-        private_key = open(config.tls_config.key_file, "rb").read()
-        certificate_chain = open(config.tls_config.cert_file, "rb").read()
+    if strategy == "mtls":
+        assert root_ca_file
+        assert key_file
+        assert cert_file
 
-        credentials = grpc.ssl_channel_credentials(
-            root_certificates=root,
-            private_key=private_key,
-            certificate_chain=certificate_chain,
+        return grpc.ssl_channel_credentials(
+            root_certificates=_read_file(root_ca_file),
+            private_key=_read_file(key_file),
+            certificate_chain=_read_file(cert_file),
         )
 
+    return None
+
+
+def _load_channel_credentials(
+    strategy: str,
+    root_ca_file: str | None,
+    key_file: str | None,
+    cert_file: str | None,
+) -> grpc.ChannelCredentials | None:
+    if strategy not in ("tls", "mtls"):
+        return None
+
+    return _cached_channel_credentials(
+        strategy,
+        root_ca_file,
+        key_file,
+        cert_file,
+        tuple(_mtime_ns(path) for path in (root_ca_file, key_file, cert_file)),
+    )
+
+
+@overload
+def new_conn(
+    config: "ClientConfig", aio: Literal[False], local_subchannel_pool: bool = False
+) -> grpc.Channel: ...
+
+
+@overload
+def new_conn(
+    config: "ClientConfig", aio: Literal[True], local_subchannel_pool: bool = False
+) -> grpc.aio.Channel: ...
+
+
+def new_conn(
+    config: "ClientConfig", aio: bool, local_subchannel_pool: bool = False
+) -> grpc.Channel | grpc.aio.Channel:
+    credentials = _load_channel_credentials(
+        config.tls_config.strategy,
+        config.tls_config.root_ca_file,
+        config.tls_config.key_file,
+        config.tls_config.cert_file,
+    )
+
     start = grpc if not aio else grpc.aio
 
     channel_options: list[tuple[str, str | int]] = [
@@ -53,6 +106,11 @@ def new_conn(config: "ClientConfig", aio: bool) -> grpc.Channel | grpc.aio.Chann
         ("grpc.keepalive_permit_without_calls", 1),
     ]
 
+    # By default, channels with identical arguments share their subchannels (and so their TCP connection).
+    # A local subchannel pool gives the channel its own connection, which is what makes channel pooling useful.
+    if local_subchannel_pool:
+        channel_options.append(("grpc.use_local_subchannel_pool", 1))
+
     # Set environment variable to disable fork support. Reference: https://github.com/grpc/grpc/issues/28557
     # When steps execute via os.fork, we see `TSI_DATA_CORRUPTED` errors.
     os.environ["GRPC_ENABLE_FORK_SUPPORT"] = "False"
@@ -2,6 +2,7 @@ import inspect
 import json
 import traceback
 from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event
 from typing import Any, cast
 from warnings import warn
 
@@ -32,6 +33,10 @@ from hatchet_sdk.workflow_run import WorkflowRunRef
 DEFAULT_WORKFLOW_POLLING_INTERVAL = 5  # Seconds
 
 
+class StepRunCancelledError(Exception):
+    """Raised by `Context.check_cancel` once the step run has been cancelled."""
+
+
 def get_caller_file_path() -> str:
     caller_frame = inspect.stack()[2]
 
@@ -77,7 +82,9 @@ class Context:
         self.stepRunId = action.step_run_id
 
         self.step_run_id: str = action.step_run_id
-        self.exit_flag = False
+        # Set when the run is cancelled. Sync steps run in a thread that can't be interrupted, so they
+        # have to check it themselves (through `done` or `check_cancel`) to stop early
+        self.cancel_token = Event()
         self.dispatcher_client = dispatcher_client
         self.admin_client = admin_client
         self.event_client = event_client
@@ -122,10 +129,10 @@ class Context:
         return trigger_options
 
     def step_output(self, step: str) -> dict[str, Any] | BaseModel:
-        workflow_validator = next(
-            (v for k, v in self.validator_registry.items() if k.split(":")[-1] == step),
-            None,
-        )
+        # Parents always belong to the same workflow as this step, so their validator is looked up
+        # directly under this action's service name rather than by scanning the whole registry
+        service_name = self.action.action_id.rpartition(":")[0]
+        workflow_validator = self.validator_registry.get(f"{service_name}:{step}")
 
         try:
             parent_step_data = cast(dict[str, Any], self.data["parents"][step])
@@ -151,11 +158,26 @@ class Context:
 
     def cancel(self) -> None:
         logger.debug("cancelling step...")
-        self.exit_flag = True
+        self.cancel_token.set()
+
+    @property
+    def exit_flag(self) -> bool:
+        return self.cancel_token.is_set()
+
+    @exit_flag.setter
+    def exit_flag(self, value: bool) -> None:
+        if value:
+            self.cancel_token.set()
+        else:
+            self.cancel_token.clear()
 
     # done returns true if the context has been cancelled
     def done(self) -> bool:
-        return self.exit_flag
+        return self.cancel_token.is_set()
+
+    def check_cancel(self) -> None:
+        if self.cancel_token.is_set():
+            raise StepRunCancelledError(f"step run {self.step_run_id} was cancelled")
 
     def playground(self, name: str, default: str | None = None) -> str | None:
         # if the key exists in the overrides_data field, return the value
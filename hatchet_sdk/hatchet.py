@@ -209,8 +209,8 @@ class Hatchet:
     def declare_workflow(
         self,
         name: str = "",
-        on_events: list[str] = [],
-        on_crons: list[str] = [],
+        on_events: list[str] | None = None,
+        on_crons: list[str] | None = None,
         version: str = "",
         timeout: str = "60m",
         schedule_timeout: str = "5m",
@@ -222,8 +222,8 @@ class Hatchet:
         return WorkflowDeclaration[TWorkflowInput](
             WorkflowConfig(
                 name=name,
-                on_events=on_events,
-                on_crons=on_crons,
+                on_events=on_events or [],
+                on_crons=on_crons or [],
                 version=version,
                 timeout=timeout,
                 schedule_timeout=schedule_timeout,
@@ -1,11 +1,19 @@
-import json
+from functools import cached_property
 from logging import Logger, getLogger
+from warnings import warn
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from hatchet_sdk.token import get_addresses_from_jwt, get_tenant_id_from_jwt
 
+__all__ = [
+    "ClientConfig",
+    "ClientTLSConfig",
+    "HealthcheckConfig",
+    "DEFAULT_HOST_PORT",
+]
+
 
 def create_settings_config(env_prefix: str) -> SettingsConfigDict:
     return SettingsConfigDict(
@@ -52,8 +60,8 @@ class ClientConfig(BaseSettings):
     server_url: str = "https://app.dev.hatchet-tools.com"
     namespace: str = ""
 
-    tls_config: ClientTLSConfig = Field(default_factory=lambda: ClientTLSConfig())
-    healthcheck: HealthcheckConfig = Field(default_factory=lambda: HealthcheckConfig())
+    tls_config: ClientTLSConfig = Field(default_factory=ClientTLSConfig)
+    healthcheck: HealthcheckConfig = Field(default_factory=HealthcheckConfig)
 
     listener_v2_timeout: int | None = None
     grpc_max_recv_message_length: int = Field(
@@ -62,9 +70,41 @@ class ClientConfig(BaseSettings):
     grpc_max_send_message_length: int = Field(
         default=4 * 1024 * 1024, description="4MB default"
     )
+    grpc_channel_pool_size: int = Field(
+        default=4,
+        ge=1,
+        description="Number of channels the event client spreads calls across",
+    )
+    grpc_compression: bool = Field(
+        default=False,
+        description="Gzip-compress bulk event pushes, which are large and highly compressible",
+    )
+    event_batch_window_ms: int = Field(
+        default=10,
+        ge=1,
+        description="How long `push_batched` buffers events before flushing them",
+    )
+    event_batch_max_size: int = Field(
+        default=100,
+        ge=1,
+        description="Number of buffered events that triggers an early `push_batched` flush",
+    )
 
     worker_preset_labels: dict[str, str] = Field(default_factory=dict)
-    enable_force_kill_sync_threads: bool = False
+    enable_force_kill_sync_threads: bool = Field(
+        default=False,
+        description="Deprecated, has no effect. Sync steps should check `context.done()` or call `context.check_cancel()` to stop once cancelled",
+    )
+    pin_sync_step_threads: bool = Field(
+        default=False,
+        description="Pin each thread that runs sync steps to its own CPU, round robin (Linux only)",
+    )
+    numa_node: int | None = Field(
+        default=None,
+        ge=0,
+        description="Restrict the runner's event loop and threads to the CPUs of this NUMA node (Linux only). "
+        "Run one worker per node to use several, and combine with `numactl --membind` to keep memory local",
+    )
 
     @model_validator(mode="after")
     def validate_token_and_tenant(self) -> "ClientConfig":
@@ -104,6 +144,19 @@ class ClientConfig(BaseSettings):
 
         return int(value)
 
+    @field_validator("enable_force_kill_sync_threads")
+    @classmethod
+    def validate_enable_force_kill_sync_threads(cls, value: bool) -> bool:
+        if value:
+            warn(
+                "`enable_force_kill_sync_threads` is deprecated and has no effect, sync steps should "
+                "check `context.done()` or call `context.check_cancel()` to stop once cancelled.",
+                DeprecationWarning,
+                stacklevel=1,
+            )
+
+        return value
+
     @field_validator("namespace")
     @classmethod
     def validate_namespace(cls, namespace: str) -> str:
@@ -113,5 +166,19 @@ class ClientConfig(BaseSettings):
             namespace = f"{namespace}_"
         return namespace.lower()
 
+    # A cached_property (rather than a private attribute) keeps the cached value out of `__eq__`,
+    # so that hashing a config doesn't make it compare unequal to an identical one.
+    @cached_property
+    def _content_hash(self) -> int:
+        return hash(
+            (
+                self.token,
+                self.host_port,
+                self.tenant_id,
+                self.namespace,
+                self.server_url,
+            )
+        )
+
     def __hash__(self) -> int:
-        return hash(json.dumps(self.model_dump(), default=str))
+        return self._content_hash
@@ -194,6 +194,18 @@ class HatchetInstrumentor(BaseInstrumentor):  # type: ignore[misc]
             self._wrap_bulk_push_event,
         )
 
+        wrap_function_wrapper(
+            hatchet_sdk,
+            "clients.events.EventClient.aio_push",
+            self._wrap_async_push_event,
+        )
+
+        wrap_function_wrapper(
+            hatchet_sdk,
+            "clients.events.EventClient.aio_bulk_push",
+            self._wrap_async_bulk_push_event,
+        )
+
         wrap_function_wrapper(
             hatchet_sdk,
             "clients.admin.AdminClient.run_workflow",
@@ -231,9 +243,13 @@ class HatchetInstrumentor(BaseInstrumentor):  # type: ignore[misc]
 
         with self._tracer.start_as_current_span(
             "hatchet.start_step_run",
-            attributes=action.otel_attributes,
             context=traceparent,
         ) as span:
+            # Building the attributes serializes the action payload, so it's skipped for spans that
+            # won't be recorded anyway (e.g. no SDK tracer provider is configured, or the span is sampled out)
+            if span.is_recording():
+                span.set_attributes(action.otel_attributes)
+
             result = await wrapped(*args, **kwargs)
 
             if isinstance(result, Exception):
@@ -253,8 +269,10 @@ class HatchetInstrumentor(BaseInstrumentor):  # type: ignore[misc]
 
         with self._tracer.start_as_current_span(
             "hatchet.get_group_key_run",
-            attributes=action.otel_attributes,
         ) as span:
+            if span.is_recording():
+                span.set_attributes(action.otel_attributes)
+
             result = await wrapped(*args, **kwargs)
 
             if isinstance(result, Exception):
@@ -315,6 +333,45 @@ class HatchetInstrumentor(BaseInstrumentor):  # type: ignore[misc]
         ):
             return wrapped(*args, **kwargs)
 
+    ## IMPORTANT: Keep these types in sync with the wrapped method's signature
+    async def _wrap_async_push_event(
+        self,
+        wrapped: Callable[
+            [str, dict[str, Any], PushEventOptions | None],
+            Coroutine[None, None, Event],
+        ],
+        instance: EventClient,
+        args: tuple[
+            str,
+            dict[str, Any],
+            PushEventOptions | None,
+        ],
+        kwargs: dict[str, str | dict[str, Any] | PushEventOptions | None],
+    ) -> Event:
+        with self._tracer.start_as_current_span(
+            "hatchet.push_event",
+        ):
+            return await wrapped(*args, **kwargs)
+
+    ## IMPORTANT: Keep these types in sync with the wrapped method's signature
+    async def _wrap_async_bulk_push_event(
+        self,
+        wrapped: Callable[
+            [list[BulkPushEventWithMetadata], PushEventOptions | None],
+            Coroutine[None, None, list[Event]],
+        ],
+        instance: EventClient,
+        args: tuple[
+            list[BulkPushEventWithMetadata],
+            PushEventOptions | None,
+        ],
+        kwargs: dict[str, list[BulkPushEventWithMetadata] | PushEventOptions | None],
+    ) -> list[Event]:
+        with self._tracer.start_as_current_span(
+            "hatchet.bulk_push_event",
+        ):
+            return await wrapped(*args, **kwargs)
+
     ## IMPORTANT: Keep these types in sync with the wrapped method's signature
     def _wrap_run_workflow(
         self,
@@ -390,6 +447,8 @@ class HatchetInstrumentor(BaseInstrumentor):  # type: ignore[misc]
         unwrap(hatchet_sdk, "worker.runner.runner.Runner.handle_cancel_action")
         unwrap(hatchet_sdk, "clients.events.EventClient.push")
         unwrap(hatchet_sdk, "clients.events.EventClient.bulk_push")
+        unwrap(hatchet_sdk, "clients.events.EventClient.aio_push")
+        unwrap(hatchet_sdk, "clients.events.EventClient.aio_bulk_push")
         unwrap(hatchet_sdk, "clients.admin.AdminClient.run_workflow")
         unwrap(hatchet_sdk, "clients.admin.AdminClient.aio_run_workflow")
         unwrap(hatchet_sdk, "clients.admin.AdminClient.run_workflows")
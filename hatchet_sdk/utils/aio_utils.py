@@ -1,8 +1,12 @@
 import asyncio
+import contextvars
 import inspect
 from concurrent.futures import Executor
 from functools import partial, wraps
-from typing import Any
+from typing import Any, Callable, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
 
 
 ## TODO: Stricter typing here
@@ -48,7 +52,7 @@ def sync_to_async(func: Any) -> Any:
         *args: Any,
         loop: asyncio.AbstractEventLoop | None = None,
         executor: Executor | None = None,
-        **kwargs: Any
+        **kwargs: Any,
     ) -> Any:
         """
         The asynchronous wrapper function that runs the given function in an executor.
@@ -95,3 +99,27 @@ def get_active_event_loop() -> asyncio.AbstractEventLoop | None:
             return None
         else:
             raise e
+
+
+async def to_thread_fast(
+    func: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs
+) -> R:
+    """
+    Equivalent to `asyncio.to_thread`, except that `func` is only run inside a copy of the
+    current context when that context actually holds any context variables.
+
+    Args:
+        func (callable): The synchronous function to run in the default executor.
+        *args: Positional arguments to pass to the function.
+        **kwargs: Keyword arguments to pass to the function.
+
+    Returns:
+        The result of the function call.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+
+    if len(ctx) == 0:
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    return await loop.run_in_executor(None, partial(ctx.run, func, *args, **kwargs))
@@ -15,7 +15,11 @@ from hatchet_sdk.clients.dispatcher.action_listener import (
 )
 from hatchet_sdk.clients.dispatcher.dispatcher import DispatcherClient
 from hatchet_sdk.contracts.dispatcher_pb2 import (
+    GROUP_KEY_EVENT_TYPE_COMPLETED,
+    GROUP_KEY_EVENT_TYPE_FAILED,
     GROUP_KEY_EVENT_TYPE_STARTED,
+    STEP_EVENT_TYPE_COMPLETED,
+    STEP_EVENT_TYPE_FAILED,
     STEP_EVENT_TYPE_STARTED,
     ActionType,
 )
@@ -33,6 +37,24 @@ class ActionEvent:
     payload: str
 
 
+# Events sent back by the runner as (run id, event type, payload). The listener already holds the action for
+# each run it handed out, so the runner doesn't have to pickle it back through the queue.
+RunnerEvent = tuple[str, Any, str]
+
+# After one of these the run is finished, and its action is no longer needed
+TERMINAL_EVENT_TYPES = frozenset(
+    (
+        STEP_EVENT_TYPE_COMPLETED,
+        STEP_EVENT_TYPE_FAILED,
+        GROUP_KEY_EVENT_TYPE_COMPLETED,
+        GROUP_KEY_EVENT_TYPE_FAILED,
+    )
+)
+
+# Sent by the runner in place of a terminal event for runs that end without reporting back (they were
+# cancelled, or it has no step for their action), so their action is dropped without sending anything
+RUN_RELEASED: Literal["RUN_RELEASED"] = "RUN_RELEASED"
+
 STOP_LOOP_TYPE = Literal["STOP_LOOP"]
 STOP_LOOP: STOP_LOOP_TYPE = "STOP_LOOP"  # Sentinel object to stop the loop
 
@@ -53,7 +75,7 @@ class WorkerActionListenerProcess:
     max_runs: int
     config: ClientConfig
     action_queue: "Queue[Action]"
-    event_queue: "Queue[ActionEvent | STOP_LOOP_TYPE]"
+    event_queue: "Queue[ActionEvent | list[RunnerEvent] | STOP_LOOP_TYPE]"
     handle_kill: bool = True
     debug: bool = False
     labels: dict[str, str | int] = field(default_factory=dict)
@@ -66,6 +88,7 @@ class WorkerActionListenerProcess:
     event_send_loop_task: asyncio.Task[None] | None = field(init=False, default=None)
 
     running_step_runs: dict[str, float] = field(init=False, default_factory=dict)
+    actions_by_run_id: dict[str, Action] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         if self.debug:
@@ -109,19 +132,47 @@ class WorkerActionListenerProcess:
         self.blocked_main_loop = asyncio.create_task(self.start_blocked_main_loop())
 
     # TODO move event methods to separate class
-    async def _get_event(self) -> ActionEvent | STOP_LOOP_TYPE:
+    async def _get_event(self) -> ActionEvent | list[RunnerEvent] | STOP_LOOP_TYPE:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.event_queue.get)
 
+    def _resolve_runner_event(self, runner_event: RunnerEvent) -> ActionEvent | None:
+        run_id, event_type, payload = runner_event
+
+        if event_type == RUN_RELEASED:
+            self.actions_by_run_id.pop(run_id, None)
+            return None
+
+        if event_type in TERMINAL_EVENT_TYPES:
+            action = self.actions_by_run_id.pop(run_id, None)
+        else:
+            action = self.actions_by_run_id.get(run_id)
+
+        if action is None:
+            logger.warning(f"dropping event for unknown run: {run_id}/{event_type}")
+            return None
+
+        return ActionEvent(action=action, type=event_type, payload=payload)
+
     async def start_event_send_loop(self) -> None:
         while True:
-            event = await self._get_event()
-            if event == STOP_LOOP:
+            item = await self._get_event()
+            if item == STOP_LOOP:
                 logger.debug("stopping event send loop...")
                 break
 
-            logger.debug(f"tx: event: {event.action.action_id}/{event.type}")
-            asyncio.create_task(self.send_event(event))
+            # The runner sends its events in batches, while this process queues its own one at a time
+            if isinstance(item, list):
+                events = [self._resolve_runner_event(e) for e in item]
+            else:
+                events = [item]
+
+            for event in events:
+                if event is None:
+                    continue
+
+                logger.debug(f"tx: event: {event.action.action_id}/{event.type}")
+                asyncio.create_task(self.send_event(event))
 
     async def start_blocked_main_loop(self) -> None:
         threshold = 1
@@ -198,6 +249,7 @@ class WorkerActionListenerProcess:
                 # Process the action here
                 match action.action_type:
                     case ActionType.START_STEP_RUN:
+                        self.actions_by_run_id[action.step_run_id] = action
                         self.event_queue.put(
                             ActionEvent(
                                 action=action,
@@ -217,7 +269,11 @@ class WorkerActionListenerProcess:
 
                     case ActionType.CANCEL_STEP_RUN:
                         logger.info(f"rx: cancel step run: {action.step_run_id}")
+
+                        ## IMPORTANT: The action is kept until the runner reports back, the run can still
+                        ## complete or fail while the runner waits for it to stop
                     case ActionType.START_GET_GROUP_KEY:
+                        self.actions_by_run_id[action.get_group_key_run_id] = action
                         self.event_queue.put(
                             ActionEvent(
                                 action=action,
@@ -1,26 +1,31 @@
 import asyncio
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from multiprocessing import Queue
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from hatchet_sdk.client import Client, new_client_raw
 from hatchet_sdk.clients.dispatcher.action_listener import Action
 from hatchet_sdk.loader import ClientConfig
 from hatchet_sdk.logger import logger
 from hatchet_sdk.utils.types import WorkflowValidator
-from hatchet_sdk.worker.action_listener_process import ActionEvent
+from hatchet_sdk.worker.action_listener_process import ActionEvent, RunnerEvent
 from hatchet_sdk.worker.runner.runner import Runner
 from hatchet_sdk.worker.runner.utils.capture_logs import capture_logs
 
 if TYPE_CHECKING:
     from hatchet_sdk.workflow import Step
 
-STOP_LOOP_TYPE = Literal["STOP_LOOP"]
-STOP_LOOP: STOP_LOOP_TYPE = "STOP_LOOP"
-
 T = TypeVar("T")
 
+# Up to this many actions are read off the queue per trip through the queue executor
+ACTION_QUEUE_BATCH_SIZE = 32
+
+# How often a blocked read of the action queue wakes up to check whether the runner is shutting down
+ACTION_QUEUE_POLL_INTERVAL_SECONDS = 0.1
+
 
 @dataclass
 class WorkerActionRunLoopManager:
@@ -29,8 +34,8 @@ class WorkerActionRunLoopManager:
     validator_registry: dict[str, WorkflowValidator]
     max_runs: int | None
     config: ClientConfig
-    action_queue: "Queue[Action | STOP_LOOP_TYPE]"
-    event_queue: "Queue[ActionEvent]"
+    action_queue: "Queue[Action]"
+    event_queue: "Queue[ActionEvent | list[RunnerEvent]]"
     loop: asyncio.AbstractEventLoop
     handle_kill: bool = True
     debug: bool = False
@@ -41,14 +46,26 @@ class WorkerActionRunLoopManager:
     killing: bool = field(init=False, default=False)
     runner: Runner | None = field(init=False, default=None)
 
+    # Only one thread ever blocks on the action queue, so it gets a dedicated executor instead of
+    # competing with other users of the loop's default executor
+    _queue_executor: ThreadPoolExecutor = field(init=False)
+
+    _task: "asyncio.Task[None] | None" = field(init=False, default=None)
+
     def __post_init__(self) -> None:
         if self.debug:
             logger.setLevel(logging.DEBUG)
         self.client = new_client_raw(self.config, self.debug)
-        self.start()
+        self._queue_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hatchet-action-queue"
+        )
+
+    def start(self, retry_count: int = 1) -> "asyncio.Task[None]":
+        ## IMPORTANT: Construction no longer schedules anything, callers must start the manager
+        ## and keep (or await) the returned task
+        self._task = self.loop.create_task(self.aio_start(retry_count))
 
-    def start(self, retry_count: int = 1) -> None:
-        k = self.loop.create_task(self.aio_start(retry_count))  # noqa: F841
+        return self._task
 
     async def aio_start(self, retry_count: int = 1) -> None:
         await capture_logs(
@@ -67,7 +84,12 @@ class WorkerActionRunLoopManager:
     def cleanup(self) -> None:
         self.killing = True
 
-        self.action_queue.put(STOP_LOOP)
+        if self.runner is not None:
+            self.runner.stop_event_drainer()
+
+        # The queue reader notices `killing` within one poll interval, so its thread isn't left
+        # blocked on the queue
+        self._queue_executor.shutdown(wait=False)
 
     async def wait_for_tasks(self) -> None:
         if self.runner:
@@ -85,18 +107,51 @@ class WorkerActionRunLoopManager:
             self.labels,
         )
 
-        logger.debug(f"'{self.name}' waiting for {list(self.action_registry.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "'%s' waiting for %s", self.name, list(self.action_registry.keys())
+            )
+
         while not self.killing:
-            action = await self._get_action()
-            if action == STOP_LOOP:
+            actions = await self._get_actions()
+            if not actions:
                 logger.debug("stopping action runner loop...")
                 break
 
-            self.runner.run(action)
+            # Everything drained in one trip through the executor is dispatched without
+            # yielding back to the loop in between
+            for action in actions:
+                self.runner.run(action)
         logger.debug("action runner loop stopped")
 
-    async def _get_action(self) -> Action | STOP_LOOP_TYPE:
-        return await self.loop.run_in_executor(None, self.action_queue.get)
+    def _get_actions_batch(self) -> list[Action]:
+        actions: list[Action] = []
+
+        while not actions:
+            if self.killing:
+                return actions
+
+            try:
+                actions.append(
+                    self.action_queue.get(timeout=ACTION_QUEUE_POLL_INTERVAL_SECONDS)
+                )
+            except queue.Empty:
+                continue
+
+        # Whatever else is already waiting is picked up without going back through the executor
+        while len(actions) < ACTION_QUEUE_BATCH_SIZE:
+            try:
+                actions.append(self.action_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return actions
+
+    async def _get_actions(self) -> list[Action]:
+        # An empty batch means the runner is shutting down
+        return await self.loop.run_in_executor(
+            self._queue_executor, self._get_actions_batch
+        )
 
     async def exit_gracefully(self) -> None:
         if self.killing:
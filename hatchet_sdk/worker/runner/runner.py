@@ -1,15 +1,20 @@
 import asyncio
 import contextvars
-import ctypes
-import functools
+import itertools
 import json
+import logging
+import os
+import time
 import traceback
+import weakref
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from multiprocessing import Queue
-from threading import Thread, current_thread
-from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar, cast
+from threading import Condition, Thread, current_thread
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar
 
+import orjson
 from pydantic import BaseModel
 
 from hatchet_sdk.client import new_client_raw
@@ -18,7 +23,7 @@ from hatchet_sdk.clients.dispatcher.action_listener import Action
 from hatchet_sdk.clients.dispatcher.dispatcher import DispatcherClient
 from hatchet_sdk.clients.run_event_listener import RunEventListenerClient
 from hatchet_sdk.clients.workflow_listener import PooledWorkflowRunListener
-from hatchet_sdk.context.context import Context
+from hatchet_sdk.context.context import Context, StepRunCancelledError
 from hatchet_sdk.context.worker_context import WorkerContext
 from hatchet_sdk.contracts.dispatcher_pb2 import (
     GROUP_KEY_EVENT_TYPE_COMPLETED,
@@ -32,14 +37,80 @@ from hatchet_sdk.contracts.dispatcher_pb2 import (
 from hatchet_sdk.loader import ClientConfig
 from hatchet_sdk.logger import logger
 from hatchet_sdk.utils.types import WorkflowValidator
-from hatchet_sdk.worker.action_listener_process import ActionEvent
-from hatchet_sdk.worker.runner.utils.capture_logs import copy_context_vars, sr, wr
+from hatchet_sdk.worker.action_listener_process import RUN_RELEASED, RunnerEvent
+from hatchet_sdk.worker.runner.utils.capture_logs import sr, wr
 
 T = TypeVar("T")
 
 if TYPE_CHECKING:
     from hatchet_sdk.workflow import Step
 
+# While events keep coming, how long the event drainer lets them pile up before sending them to the
+# listener process together
+EVENT_BATCH_WINDOW_SECONDS = 0.005
+
+# A batch this large is sent without waiting out the rest of the window
+EVENT_BATCH_MAX_SIZE = 100
+
+
+def _cpu_pinning_initializer() -> Callable[[], None] | None:
+    # `os.sched_setaffinity` is only available on Linux
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+
+    cpus = itertools.cycle(sorted(os.sched_getaffinity(0)))
+
+    def pin_thread() -> None:
+        # With a pid of 0 this only applies to the calling thread
+        os.sched_setaffinity(0, {next(cpus)})
+
+    return pin_thread
+
+
+def _parse_cpulist(cpulist: str) -> set[int]:
+    """Parses a kernel cpulist such as `0-3,8-11` into the CPUs it names."""
+    cpus: set[int] = set()
+
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+
+        start, _, end = part.partition("-")
+        cpus.update(range(int(start), int(end or start) + 1))
+
+    return cpus
+
+
+def _pin_to_numa_node(node: int) -> None:
+    # `os.sched_setaffinity` is only available on Linux
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("NUMA node pinning is only supported on Linux, ignoring it")
+        return
+
+    try:
+        with open(f"/sys/devices/system/node/node{node}/cpulist") as f:
+            node_cpus = _parse_cpulist(f.read())
+    except OSError as e:
+        logger.warning(f"could not read the CPUs of NUMA node {node}: {e}")
+        return
+
+    cpus = node_cpus & os.sched_getaffinity(0)
+
+    if not cpus:
+        logger.warning(f"none of the CPUs of NUMA node {node} are available")
+        return
+
+    # This pins the calling thread, and every thread it starts afterwards inherits the affinity
+    os.sched_setaffinity(0, cpus)
+
+
+@dataclass(slots=True)
+class RunState:
+    context: Context
+    task: "asyncio.Task[Any]"
+    # Only set for sync steps, once they start running in the thread pool
+    thread: Thread | None = None
+
 
 class WorkerStatus(Enum):
     INITIALIZED = 1
@@ -48,6 +119,26 @@ class WorkerStatus(Enum):
     UNHEALTHY = 4
 
 
+# The log line and handler for each action type the runner accepts. Handlers go through the runner's
+# attributes when called, so the OTel instrumentor's wrappers still apply.
+_ACTION_HANDLERS: dict[
+    int, tuple[str, Callable[["Runner", Action], Coroutine[Any, Any, Any]]]
+] = {
+    ActionType.START_STEP_RUN: (
+        "run: start step: {0.action_id}/{0.step_run_id}",
+        lambda runner, action: runner.handle_start_step_run(action),
+    ),
+    ActionType.CANCEL_STEP_RUN: (
+        "cancel: step run:  {0.action_id}/{0.step_run_id}",
+        lambda runner, action: runner.handle_cancel_action(action.step_run_id),
+    ),
+    ActionType.START_GET_GROUP_KEY: (
+        "run: get group key:  {0.action_id}/{0.get_group_key_run_id}",
+        lambda runner, action: runner.handle_start_group_key_run(action),
+    ),
+}
+
+
 class Runner:
     def __init__(
         self,
@@ -55,30 +146,67 @@ class Runner:
         event_queue: "Queue[Any]",
         max_runs: int | None = None,
         handle_kill: bool = True,
-        action_registry: dict[str, "Step[T]"] = {},
-        validator_registry: dict[str, WorkflowValidator] = {},
+        action_registry: dict[str, "Step[T]"] | None = None,
+        validator_registry: dict[str, WorkflowValidator] | None = None,
         config: ClientConfig = ClientConfig(),
-        labels: dict[str, str | int] = {},
+        labels: dict[str, str | int] | None = None,
     ):
         # We store the config so we can dynamically create clients for the dispatcher client.
         self.config = config
         self.client = new_client_raw(config)
         self.name = self.client.config.namespace + name
+
+        ## IMPORTANT: This has to happen before any of the runner's threads are started, so that they
+        ## inherit the node's CPUs (and the pinned thread pool cycles through only those)
+        if self.client.config.numa_node is not None:
+            _pin_to_numa_node(self.client.config.numa_node)
+
         self.max_runs = max_runs
-        self.tasks: dict[str, asyncio.Task[Any]] = {}  # Store run ids and futures
-        self.contexts: dict[str, Context] = {}  # Store run ids and contexts
-        self.action_registry: dict[str, "Step[T]"] = action_registry
-        self.validator_registry = validator_registry
+        # Store run ids and everything needed to cancel them
+        self.runs: dict[str, RunState] = {}
+        # Set whenever there are no runs in progress
+        self._tasks_drained = asyncio.Event()
+        self._tasks_drained.set()
+        # JSON of frozen model outputs by `id`, so returning the same instance again doesn't dump it
+        # again. Equal models can still dump differently (e.g. `1` and `True`), so lookups go by
+        # identity, checked through the weakref.
+        self._frozen_output_json: dict[int, tuple["weakref.ref[BaseModel]", str]] = {}
+        self.action_registry: dict[str, "Step[T]"] = (
+            {} if action_registry is None else action_registry
+        )
+        self.validator_registry = (
+            {} if validator_registry is None else validator_registry
+        )
 
         self.event_queue = event_queue
 
+        # Events are handed to the listener process in batches, so that a burst of step runs finishing
+        # costs one pickle and pipe write instead of one per event
+        self._pending_events: list[RunnerEvent] = []
+        self._pending_events_cond = Condition()
+        self._event_drainer_stopping = False
+        self._event_drainer = Thread(
+            target=self._drain_events, name="hatchet-event-drainer", daemon=True
+        )
+        self._event_drainer.start()
+
         # The thread pool is used for synchronous functions which need to run concurrently
-        self.thread_pool = ThreadPoolExecutor(max_workers=max_runs)
-        self.threads: Dict[str, Thread] = {}  # Store run ids and threads
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=max_runs,
+            initializer=(
+                _cpu_pinning_initializer()
+                if self.client.config.pin_sync_step_threads
+                else None
+            ),
+        )
 
         self.killing = False
         self.handle_kill = handle_kill
 
+        # The runner is always created from inside the action loop, so the loop is looked up once here
+        # rather than for every action
+        self.loop = asyncio.get_running_loop()
+
         # We need to initialize a new admin and dispatcher client *after* we've started the event loop,
         # otherwise the grpc.aio methods will use a different event loop and we'll get a bunch of errors.
         self.dispatcher_client = DispatcherClient(self.config)
@@ -87,7 +215,7 @@ class Runner:
         self.client.workflow_listener = PooledWorkflowRunListener(self.config)
 
         self.worker_context = WorkerContext(
-            labels=labels, client=new_client_raw(config).dispatcher
+            labels={} if labels is None else labels, client=self.client.dispatcher
         )
 
     def create_workflow_run_url(self, action: Action) -> str:
@@ -97,117 +225,90 @@ class Runner:
         if self.worker_context.id() is None:
             self.worker_context._worker_id = action.worker_id
 
-        match action.action_type:
-            case ActionType.START_STEP_RUN:
-                log = f"run: start step: {action.action_id}/{action.step_run_id}"
-                logger.info(log)
-                asyncio.create_task(self.handle_start_step_run(action))
-            case ActionType.CANCEL_STEP_RUN:
-                log = f"cancel: step run:  {action.action_id}/{action.step_run_id}"
-                logger.info(log)
-                asyncio.create_task(self.handle_cancel_action(action.step_run_id))
-            case ActionType.START_GET_GROUP_KEY:
-                log = f"run: get group key:  {action.action_id}/{action.get_group_key_run_id}"
-                logger.info(log)
-                asyncio.create_task(self.handle_start_group_key_run(action))
-            case _:
-                log = f"unknown action type: {action.action_type}"
-                logger.error(log)
-
-    def step_run_callback(self, action: Action) -> Callable[[asyncio.Task[Any]], None]:
-        def inner_callback(task: asyncio.Task[Any]) -> None:
-            self.cleanup_run_id(action.step_run_id)
-
-            errored = False
-            cancelled = task.cancelled()
-
-            # Get the output from the future
-            try:
-                if not cancelled:
-                    output = task.result()
-            except Exception as e:
-                errored = True
+        handler = _ACTION_HANDLERS.get(action.action_type)
 
-                # This except is coming from the application itself, so we want to send that to the Hatchet instance
-                self.event_queue.put(
-                    ActionEvent(
-                        action=action,
-                        type=STEP_EVENT_TYPE_FAILED,
-                        payload=str(errorWithTraceback(f"{e}", e)),
-                    )
-                )
+        if handler is None:
+            logger.error(f"unknown action type: {action.action_type}")
+            return
 
-                logger.error(
-                    f"failed step run: {action.action_id}/{action.step_run_id}"
-                )
+        log, handle = handler
+        # Checked per call since the level can change at runtime, logging caches the check itself
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(log.format(action))
+        self.loop.create_task(handle(self, action))
 
-            if not errored and not cancelled:
-                self.event_queue.put(
-                    ActionEvent(
-                        action=action,
-                        type=STEP_EVENT_TYPE_COMPLETED,
-                        payload=self.serialize_output(output),
-                    )
-                )
+    def _put_event(self, run_id: str, event_type: Any, payload: str) -> None:
+        # The listener process already holds the action for this run, so only its id is sent back
+        event = (run_id, event_type, payload)
 
-                logger.info(
-                    f"finished step run: {action.action_id}/{action.step_run_id}"
-                )
+        with self._pending_events_cond:
+            if not self._event_drainer_stopping:
+                self._pending_events.append(event)
+                pending = len(self._pending_events)
 
-        return inner_callback
+                # The drainer only needs waking for the first event, or to cut its window short
+                if pending == 1 or pending >= EVENT_BATCH_MAX_SIZE:
+                    self._pending_events_cond.notify()
 
-    def group_key_run_callback(
-        self, action: Action
-    ) -> Callable[[asyncio.Task[Any]], None]:
-        def inner_callback(task: asyncio.Task[Any]) -> None:
-            self.cleanup_run_id(action.get_group_key_run_id)
+                return
 
-            errored = False
-            cancelled = task.cancelled()
+        # The drainer has stopped, so the event is sent on its own
+        self.event_queue.put([event])
 
-            # Get the output from the future
-            try:
-                if not cancelled:
-                    output = task.result()
-            except Exception as e:
-                errored = True
-                self.event_queue.put(
-                    ActionEvent(
-                        action=action,
-                        type=GROUP_KEY_EVENT_TYPE_FAILED,
-                        payload=str(errorWithTraceback(f"{e}", e)),
-                    )
-                )
+    def _drain_events(self) -> None:
+        last_sent = float("-inf")
 
-                logger.error(
-                    f"failed step run: {action.action_id}/{action.step_run_id}"
+        while True:
+            with self._pending_events_cond:
+                self._pending_events_cond.wait_for(
+                    lambda: self._pending_events or self._event_drainer_stopping
                 )
 
-            if not errored and not cancelled:
-                self.event_queue.put(
-                    ActionEvent(
-                        action=action,
-                        type=GROUP_KEY_EVENT_TYPE_COMPLETED,
-                        payload=self.serialize_output(output),
+                # An isolated event is sent right away. While events keep coming, each batch is given
+                # the window to fill up, unless it's already full.
+                if (
+                    not self._event_drainer_stopping
+                    and time.monotonic() - last_sent < EVENT_BATCH_WINDOW_SECONDS
+                ):
+                    self._pending_events_cond.wait_for(
+                        lambda: len(self._pending_events) >= EVENT_BATCH_MAX_SIZE
+                        or self._event_drainer_stopping,
+                        timeout=EVENT_BATCH_WINDOW_SECONDS,
                     )
-                )
 
-                logger.info(
-                    f"finished step run: {action.action_id}/{action.step_run_id}"
-                )
+                batch, self._pending_events = self._pending_events, []
+                stopping = self._event_drainer_stopping
+
+            if batch:
+                self.event_queue.put(batch)
+                last_sent = time.monotonic()
+
+            if stopping:
+                return
 
-        return inner_callback
+    def stop_event_drainer(self) -> None:
+        """Stops the event drainer thread, once it has sent every pending event."""
+        with self._pending_events_cond:
+            self._event_drainer_stopping = True
+            self._pending_events_cond.notify()
+
+        self._event_drainer.join()
 
     def thread_action_func(
         self, context: Context, step: "Step[T]", action: Action
     ) -> T:
         if action.step_run_id is not None and action.step_run_id != "":
-            self.threads[action.step_run_id] = current_thread()
+            run = self.runs.get(action.step_run_id)
         elif (
             action.get_group_key_run_id is not None
             and action.get_group_key_run_id != ""
         ):
-            self.threads[action.get_group_key_run_id] = current_thread()
+            run = self.runs.get(action.get_group_key_run_id)
+        else:
+            run = None
+
+        if run is not None:
+            run.thread = current_thread()
 
         return step.call(context)
 
@@ -226,19 +327,20 @@ class Runner:
             if step.is_async_function:
                 return await step.aio_call(context)
             else:
-                pfunc = functools.partial(
-                    # we must copy the context vars to the new thread, as only asyncio natively supports
-                    # contextvars
-                    copy_context_vars,
-                    contextvars.copy_context().items(),
+                # we must copy the context vars to the new thread, as only asyncio natively supports
+                # contextvars. Running inside the snapshot carries every var over, rather than setting
+                # them again one at a time.
+                return await self.loop.run_in_executor(
+                    self.thread_pool,
+                    contextvars.copy_context().run,
                     self.thread_action_func,
                     context,
                     step,
                     action,
                 )
-
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(self.thread_pool, pfunc)
+        except StepRunCancelledError:
+            # Stopping through `Context.check_cancel` is a cancellation, not an error in the step
+            raise
         except Exception as e:
             logger.error(
                 errorWithTraceback(
@@ -251,14 +353,11 @@ class Runner:
             self.cleanup_run_id(run_id)
 
     def cleanup_run_id(self, run_id: str | None) -> None:
-        if run_id in self.tasks:
-            del self.tasks[run_id]
+        if run_id is None or self.runs.pop(run_id, None) is None:
+            return
 
-        if run_id in self.threads:
-            del self.threads[run_id]
-
-        if run_id in self.contexts:
-            del self.contexts[run_id]
+        if not self.runs:
+            self._tasks_drained.set()
 
     def create_context(self, action: Action) -> Context:
         return Context(
@@ -283,28 +382,57 @@ class Runner:
 
         context = self.create_context(action)
 
-        self.contexts[action.step_run_id] = context
-
         if action_func:
-            self.event_queue.put(
-                ActionEvent(action=action, type=STEP_EVENT_TYPE_STARTED, payload="")
-            )
+            self._put_event(action.step_run_id, STEP_EVENT_TYPE_STARTED, "")
 
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(
+            task = self.loop.create_task(
                 self.async_wrapped_action_func(
                     context, action_func, action, action.step_run_id
                 )
             )
 
-            task.add_done_callback(self.step_run_callback(action))
-            self.tasks[action.step_run_id] = task
+            self.runs[action.step_run_id] = RunState(context, task)
+            self._tasks_drained.clear()
 
+            # The result is handled right here rather than in a done callback, which would cost another
+            # trip through the event loop for every step run
             try:
-                await task
-            except Exception:
-                # do nothing, this should be caught in the callback
-                pass
+                output = await task
+            except asyncio.CancelledError:
+                # A cancelled step run isn't reported, but the runner itself being cancelled still propagates
+                if not task.cancelled():
+                    raise
+
+                self._put_event(action.step_run_id, RUN_RELEASED, "")
+            except StepRunCancelledError:
+                # The step stopped itself through `Context.check_cancel`, which is a cancellation too
+                self._put_event(action.step_run_id, RUN_RELEASED, "")
+            except Exception as e:
+                # This except is coming from the application itself, so we want to send that to the Hatchet instance
+                self._put_event(
+                    action.step_run_id,
+                    STEP_EVENT_TYPE_FAILED,
+                    errorWithTraceback(f"{e}", e),
+                )
+
+                logger.error(
+                    f"failed step run: {action.action_id}/{action.step_run_id}"
+                )
+            else:
+                self._put_event(
+                    action.step_run_id,
+                    STEP_EVENT_TYPE_COMPLETED,
+                    self.serialize_output(output),
+                )
+
+                logger.info(
+                    "finished step run: %s/%s", action.action_id, action.step_run_id
+                )
+            finally:
+                self.cleanup_run_id(action.step_run_id)
+        else:
+            # Nothing is reported for actions this worker has no step for
+            self._put_event(action.step_run_id, RUN_RELEASED, "")
 
     ## IMPORTANT: Keep this method's signature in sync with the wrapper in the OTel instrumentor
     async def handle_start_group_key_run(self, action: Action) -> Exception | None:
@@ -321,92 +449,85 @@ class Runner:
             self.client.config.namespace,
         )
 
-        self.contexts[action.get_group_key_run_id] = context
-
         # Find the corresponding action function from the registry
         action_func = self.action_registry.get(action_name)
 
         if action_func:
             # send an event that the group key run has started
-            self.event_queue.put(
-                ActionEvent(
-                    action=action, type=GROUP_KEY_EVENT_TYPE_STARTED, payload=""
-                )
+            self._put_event(
+                action.get_group_key_run_id, GROUP_KEY_EVENT_TYPE_STARTED, ""
             )
 
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(
+            task = self.loop.create_task(
                 self.async_wrapped_action_func(
                     context, action_func, action, action.get_group_key_run_id
                 )
             )
 
-            task.add_done_callback(self.group_key_run_callback(action))
-            self.tasks[action.get_group_key_run_id] = task
+            self.runs[action.get_group_key_run_id] = RunState(context, task)
+            self._tasks_drained.clear()
 
             try:
-                await task
+                output = await task
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise
+
+                self._put_event(action.get_group_key_run_id, RUN_RELEASED, "")
+            except StepRunCancelledError:
+                # The step stopped itself through `Context.check_cancel`, which is a cancellation too
+                self._put_event(action.get_group_key_run_id, RUN_RELEASED, "")
             except Exception as e:
-                return e
-
-        return None
-
-    def force_kill_thread(self, thread: Thread) -> None:
-        """Terminate a python threading.Thread."""
-        try:
-            if not thread.is_alive():
-                return
-
-            ident = cast(int, thread.ident)
-
-            logger.info(f"Forcefully terminating thread {ident}")
+                self._put_event(
+                    action.get_group_key_run_id,
+                    GROUP_KEY_EVENT_TYPE_FAILED,
+                    errorWithTraceback(f"{e}", e),
+                )
 
-            exc = ctypes.py_object(SystemExit)
-            res = ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_long(ident), exc)
-            if res == 0:
-                raise ValueError("Invalid thread ID")
-            elif res != 1:
-                logger.error("PyThreadState_SetAsyncExc failed")
+                logger.error(
+                    f"failed step run: {action.action_id}/{action.step_run_id}"
+                )
 
-                # Call with exception set to 0 is needed to cleanup properly.
-                ctypes.pythonapi.PyThreadState_SetAsyncExc(thread.ident, 0)
-                raise SystemError("PyThreadState_SetAsyncExc failed")
+                return e
+            else:
+                self._put_event(
+                    action.get_group_key_run_id,
+                    GROUP_KEY_EVENT_TYPE_COMPLETED,
+                    self.serialize_output(output),
+                )
 
-            logger.info(f"Successfully terminated thread {ident}")
+                logger.info(
+                    "finished step run: %s/%s", action.action_id, action.step_run_id
+                )
+            finally:
+                self.cleanup_run_id(action.get_group_key_run_id)
+        else:
+            self._put_event(action.get_group_key_run_id, RUN_RELEASED, "")
 
-            # Immediately add a new thread to the thread pool, because we've actually killed a worker
-            # in the ThreadPoolExecutor
-            self.thread_pool.submit(lambda: None)
-        except Exception as e:
-            logger.exception(f"Failed to terminate thread: {e}")
+        return None
 
     ## IMPORTANT: Keep this method's signature in sync with the wrapper in the OTel instrumentor
     async def handle_cancel_action(self, run_id: str) -> None:
         try:
-            # call cancel to signal the context to stop
-            if run_id in self.contexts:
-                context = self.contexts.get(run_id)
+            run = self.runs.get(run_id)
 
-                if context:
-                    context.cancel()
+            # call cancel to signal the context to stop, and give the run up to a second to finish on
+            # its own. `asyncio.wait` neither cancels the task on timeout nor raises its exception.
+            if run:
+                run.context.cancel()
+                await asyncio.wait({run.task}, timeout=1)
 
-            await asyncio.sleep(1)
+            # the run may have finished in the meantime
+            run = self.runs.get(run_id)
 
-            if run_id in self.tasks:
-                future = self.tasks.get(run_id)
-
-                if future:
-                    future.cancel()
-
-            # check if thread is still running, if so, print a warning
-            if run_id in self.threads:
-                thread = self.threads.get(run_id)
-                if thread and self.client.config.enable_force_kill_sync_threads:
-                    self.force_kill_thread(thread)
-                    await asyncio.sleep(1)
+            if run:
+                run.task.cancel()
 
+            # check if thread is still running, if so, print a warning. Threads can't be stopped from the
+            # outside, the step has to check `context.done()` or call `context.check_cancel()` itself
+            if run and run.thread:
                 logger.warning(
-                    f"Thread {self.threads[run_id].ident} with run id {run_id} is still running after cancellation. This could cause the thread pool to get blocked and prevent new tasks from running."
+                    f"Thread {run.thread.ident} with run id {run_id} is still running after cancellation. This could cause the thread pool to get blocked and prevent new tasks from running."
                 )
         finally:
             self.cleanup_run_id(run_id)
@@ -414,9 +535,16 @@ class Runner:
     def serialize_output(self, output: Any) -> str:
 
         if isinstance(output, BaseModel):
-            return output.model_dump_json()
+            return self._serialize_model(output)
 
         if output is not None:
+            try:
+                # Non-str keys are allowed to match what `json.dumps` accepted
+                return orjson.dumps(output, option=orjson.OPT_NON_STR_KEYS).decode()
+            except Exception:
+                # orjson rejects some values `json.dumps` handles, like ints wider than 64 bits
+                pass
+
             try:
                 return json.dumps(output)
             except Exception as e:
@@ -425,14 +553,46 @@ class Runner:
 
         return ""
 
+    def _serialize_model(self, output: BaseModel) -> str:
+        if not output.model_config.get("frozen"):
+            return output.model_dump_json()
+
+        key = id(output)
+        cached = self._frozen_output_json.get(key)
+
+        if cached is not None and cached[0]() is output:
+            return cached[1]
+
+        # Frozen models can still hold mutable values, but then they aren't hashable and
+        # can't be cached
+        try:
+            hash(output)
+        except TypeError:
+            return output.model_dump_json()
+
+        dumped = output.model_dump_json()
+        cache = self._frozen_output_json
+
+        def evict(ref: "weakref.ref[BaseModel]") -> None:
+            # The id may already belong to a newer output by now
+            if cache.get(key, (None,))[0] is ref:
+                del cache[key]
+
+        cache[key] = (weakref.ref(output, evict), dumped)
+
+        return dumped
+
     async def wait_for_tasks(self) -> None:
-        running = len(self.tasks.keys())
-        while running > 0:
-            logger.info(f"waiting for {running} tasks to finish...")
-            await asyncio.sleep(1)
-            running = len(self.tasks.keys())
+        # Returns as soon as the last task is cleaned up, still reporting progress every second until then
+        while not self._tasks_drained.is_set():
+            logger.info(f"waiting for {len(self.runs)} tasks to finish...")
+
+            try:
+                await asyncio.wait_for(self._tasks_drained.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
 
 
 def errorWithTraceback(message: str, e: Exception) -> str:
-    trace = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+    trace = "".join(traceback.TracebackException.from_exception(e).format())
     return f"{message}\n{trace}"
@@ -2,9 +2,8 @@ import contextvars
 import functools
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from contextvars import ContextVar
 from io import StringIO
-from typing import Any, Awaitable, Callable, ItemsView, ParamSpec, TypeVar
+from typing import Any, Awaitable, Callable, ParamSpec, TypeVar
 
 from hatchet_sdk.clients.events import EventClient
 from hatchet_sdk.logger import logger
@@ -21,17 +20,6 @@ T = TypeVar("T")
 P = ParamSpec("P")
 
 
-def copy_context_vars(
-    ctx_vars: ItemsView[ContextVar[Any], Any],
-    func: Callable[P, T],
-    *args: P.args,
-    **kwargs: P.kwargs,
-) -> T:
-    for var, value in ctx_vars:
-        var.set(value)
-    return func(*args, **kwargs)
-
-
 class InjectingFilter(logging.Filter):
     # For some reason, only the InjectingFilter has access to the contextvars method sr.get(),
     # otherwise we would use emit within the CustomLogHandler
@@ -9,12 +9,13 @@ from enum import Enum
 from multiprocessing import Queue
 from multiprocessing.process import BaseProcess
 from types import FrameType
-from typing import TYPE_CHECKING, Any, TypeVar, Union, get_type_hints
+from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar, Union, get_type_hints
 
 from aiohttp import web
 from aiohttp.web_request import Request
 from aiohttp.web_response import Response
 from prometheus_client import Gauge, generate_latest
+from pydantic import BaseModel
 
 from hatchet_sdk.client import Client, new_client_raw
 from hatchet_sdk.clients.dispatcher.action_listener import Action
@@ -25,12 +26,10 @@ from hatchet_sdk.utils.types import WorkflowValidator
 from hatchet_sdk.utils.typing import is_basemodel_subclass
 from hatchet_sdk.worker.action_listener_process import (
     ActionEvent,
+    RunnerEvent,
     worker_action_listener_process,
 )
-from hatchet_sdk.worker.runner.run_loop_manager import (
-    STOP_LOOP_TYPE,
-    WorkerActionRunLoopManager,
-)
+from hatchet_sdk.worker.runner.run_loop_manager import WorkerActionRunLoopManager
 from hatchet_sdk.workflow import Step
 
 if TYPE_CHECKING:
@@ -39,6 +38,12 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def _step_output_type(fn: Callable[..., Any]) -> Type[BaseModel] | None:
+    return_type = get_type_hints(fn).get("return")
+
+    return return_type if is_basemodel_subclass(return_type) else None
+
+
 class WorkerStatus(Enum):
     INITIALIZED = 1
     STARTING = 2
@@ -84,8 +89,8 @@ class Worker:
 
         self.ctx = multiprocessing.get_context("spawn")
 
-        self.action_queue: "Queue[Action | STOP_LOOP_TYPE]" = self.ctx.Queue()
-        self.event_queue: "Queue[ActionEvent]" = self.ctx.Queue()
+        self.action_queue: "Queue[Action]" = self.ctx.Queue()
+        self.event_queue: "Queue[ActionEvent | list[RunnerEvent]]" = self.ctx.Queue()
 
         self.loop: asyncio.AbstractEventLoop
 
@@ -123,11 +128,10 @@ class Worker:
         for step in workflow.steps:
             action_name = workflow.create_action_name(namespace, step)
             self.action_registry[action_name] = step
-            return_type = get_type_hints(step.fn).get("return")
 
             self.validator_registry[action_name] = WorkflowValidator(
                 workflow_input=workflow.config.input_validator,
-                step_output=return_type if is_basemodel_subclass(return_type) else None,
+                step_output=_step_output_type(step.fn),
             )
 
     def status(self) -> WorkerStatus:
@@ -223,6 +227,7 @@ class Worker:
         self.action_listener_process = self._start_listener()
 
         self.action_runner = self._run_action_runner()
+        self.action_runner.start()
 
         self.action_listener_health_check = self.loop.create_task(
             self._check_listener_health()
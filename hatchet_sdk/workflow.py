@@ -1,12 +1,15 @@
-import asyncio
+import inspect
+import itertools
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
     Awaitable,
     Callable,
+    ClassVar,
     Generic,
     ParamSpec,
     Type,
@@ -68,7 +71,8 @@ class ConcurrencyLimitStrategy(str, Enum):
     CANCEL_NEWEST = "CANCEL_NEWEST"
 
 
-class ConcurrencyExpression(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConcurrencyExpression:
     """
     Defines concurrency limits for a workflow using a CEL expression.
 
@@ -85,16 +89,24 @@ class ConcurrencyExpression(BaseModel):
     max_runs: int
     limit_strategy: ConcurrencyLimitStrategy
 
+    def __post_init__(self) -> None:
+        # Plain strings (e.g. "CANCEL_IN_PROGRESS") are still accepted, as they were when this was a
+        # pydantic model
+        object.__setattr__(
+            self, "limit_strategy", ConcurrencyLimitStrategy(self.limit_strategy)
+        )
 
-TWorkflowInput = TypeVar("TWorkflowInput", bound=BaseModel, default=EmptyModel)
 
+TWorkflowInput = TypeVar("TWorkflowInput", bound=BaseModel, default=EmptyModel)
 
-class WorkflowConfig(BaseModel):
-    model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
+## IMPORTANT: This is deliberately not frozen. `BaseWorkflow.__init__` fills in `name` in place, and
+## workflows commonly share their config object with the `WorkflowDeclaration` that created it.
+@dataclass(slots=True)
+class WorkflowConfig:
     name: str = ""
-    on_events: list[str] = []
-    on_crons: list[str] = []
+    on_events: list[str] = field(default_factory=list)
+    on_crons: list[str] = field(default_factory=list)
     version: str = ""
     timeout: str = "60m"
     schedule_timeout: str = "5m"
@@ -103,6 +115,18 @@ class WorkflowConfig(BaseModel):
     concurrency: ConcurrencyExpression | None = None
     input_validator: Type[BaseModel] = EmptyModel
 
+    def __post_init__(self) -> None:
+        # The lists are copied so that configs never share them with their caller (or each other)
+        self.on_events = list(self.on_events)
+        self.on_crons = list(self.on_crons)
+
+        # Coerced the same way the pydantic model used to, so plain strings and dicts keep working
+        if self.sticky is not None:
+            self.sticky = StickyStrategy(self.sticky)
+
+        if isinstance(self.concurrency, dict):
+            self.concurrency = ConcurrencyExpression(**self.concurrency)
+
 
 class StepType(str, Enum):
     DEFAULT = "default"
@@ -116,14 +140,31 @@ StepFunc = Union[AsyncFunc[R], SyncFunc[R]]
 
 
 def is_async_fn(fn: StepFunc[R]) -> TypeGuard[AsyncFunc[R]]:
-    return asyncio.iscoroutinefunction(fn)
+    return inspect.iscoroutinefunction(fn)
 
 
 def is_sync_fn(fn: StepFunc[R]) -> TypeGuard[SyncFunc[R]]:
-    return not asyncio.iscoroutinefunction(fn)
+    return not inspect.iscoroutinefunction(fn)
 
 
 class Step(Generic[R]):
+    __slots__ = (
+        "fn",
+        "is_async_function",
+        "workflow",
+        "type",
+        "timeout",
+        "name",
+        "parents",
+        "retries",
+        "rate_limits",
+        "desired_worker_labels",
+        "backoff_factor",
+        "backoff_max_seconds",
+        "concurrency__max_runs",
+        "concurrency__limit_strategy",
+    )
+
     def __init__(
         self,
         fn: Callable[[Any, Context], R] | Callable[[Any, Context], Awaitable[R]],
@@ -140,6 +181,7 @@ class Step(Generic[R]):
         concurrency__limit_strategy: ConcurrencyLimitStrategy | None = None,
     ) -> None:
         self.fn = fn
+        # Checked once here, `call` and `aio_call` use the stored result instead of inspecting `fn`
         self.is_async_function = is_async_fn(fn)
         self.workflow: Union["BaseWorkflow", None] = None
 
@@ -164,11 +206,8 @@ class Step(Generic[R]):
         if self.is_async_function:
             raise TypeError(f"{self.name} is not a sync function. Use `acall` instead.")
 
-        sync_fn = self.fn
-        if is_sync_fn(sync_fn):
-            return sync_fn(self.workflow, ctx)
-
-        raise TypeError(f"{self.name} is not a sync function. Use `acall` instead.")
+        # `is_async_function` was resolved in `__init__`, so there's no need to re-inspect `fn` here
+        return cast(SyncFunc[R], self.fn)(self.workflow, ctx)
 
     async def aio_call(self, ctx: Context) -> R:
         if not self.is_registered:
@@ -181,12 +220,7 @@ class Step(Generic[R]):
                 f"{self.name} is not an async function. Use `call` instead."
             )
 
-        async_fn = self.fn
-
-        if is_async_fn(async_fn):
-            return await async_fn(self.workflow, ctx)
-
-        raise TypeError(f"{self.name} is not an async function. Use `call` instead.")
+        return await cast(AsyncFunc[R], self.fn)(self.workflow, ctx)
 
     @property
     def is_registered(self) -> bool:
@@ -322,6 +356,42 @@ class WorkflowDeclaration(Generic[TWorkflowInput]):
         )
 
 
+_CONCURRENCY_LIMIT_STRATEGY_NAMES = frozenset(
+    item.name for item in ConcurrencyLimitStrategyProto.DESCRIPTOR.values
+)
+_STICKY_STRATEGY_NAMES = frozenset(
+    item.name for item in StickyStrategyProto.DESCRIPTOR.values
+)
+
+
+@lru_cache(maxsize=None)
+def _concurrency_limit_strategy_to_proto(
+    concurrency: ConcurrencyLimitStrategy | None,
+) -> int | None:
+    if not concurrency:
+        return None
+
+    if concurrency.name not in _CONCURRENCY_LIMIT_STRATEGY_NAMES:
+        raise ValueError(
+            f"Concurrency limit strategy must be one of {sorted(_CONCURRENCY_LIMIT_STRATEGY_NAMES)}. Got: {concurrency}"
+        )
+
+    return ConcurrencyLimitStrategyProto.Value(concurrency.name)
+
+
+@lru_cache(maxsize=None)
+def _sticky_strategy_to_proto(sticky: StickyStrategy | None) -> int | None:
+    if not sticky:
+        return None
+
+    if sticky.name not in _STICKY_STRATEGY_NAMES:
+        raise ValueError(
+            f"Sticky strategy must be one of {sorted(_STICKY_STRATEGY_NAMES)}. Got: {sticky}"
+        )
+
+    return StickyStrategyProto.Value(sticky.name)
+
+
 class BaseWorkflow:
     """
     A Hatchet workflow implementation base. This class should be inherited by all workflow implementations.
@@ -331,6 +401,14 @@ class BaseWorkflow:
 
     config: WorkflowConfig = WorkflowConfig()
 
+    # Steps are class attributes, so they're collected once per workflow class rather than on every access
+    # Stored as tuples and handed out as fresh lists, so callers can't modify the cached steps
+    _steps_cache: ClassVar[dict[type, dict[StepType, tuple[Step[Any], ...]]]] = {}
+    _all_steps_cache: ClassVar[dict[type, tuple[Step[Any], ...]]] = {}
+    _step_opts_cache: ClassVar[
+        dict[tuple[type, str], tuple[CreateWorkflowStepOpts, ...]]
+    ] = {}
+
     def __init__(self) -> None:
         self.config.name = self.config.name or str(self.__class__.__name__)
 
@@ -341,11 +419,20 @@ class BaseWorkflow:
         return f"{namespace}{self.config.name.lower()}"
 
     def _get_steps_by_type(self, step_type: StepType) -> list[Step[Any]]:
-        return [
-            attr
-            for _, attr in self.__class__.__dict__.items()
-            if isinstance(attr, Step) and attr.type == step_type
-        ]
+        cls = self.__class__
+        steps_by_type = BaseWorkflow._steps_cache.get(cls)
+
+        if steps_by_type is None:
+            collected: dict[StepType, list[Step[Any]]] = {}
+
+            for attr in cls.__dict__.values():
+                if isinstance(attr, Step):
+                    collected.setdefault(attr.type, []).append(attr)
+
+            steps_by_type = {kind: tuple(steps) for kind, steps in collected.items()}
+            BaseWorkflow._steps_cache[cls] = steps_by_type
+
+        return list(steps_by_type.get(step_type, ()))
 
     @property
     def on_failure_steps(self) -> list[Step[Any]]:
@@ -361,7 +448,18 @@ class BaseWorkflow:
 
     @property
     def steps(self) -> list[Step[Any]]:
-        return self.default_steps + self.concurrency_actions + self.on_failure_steps
+        cls = self.__class__
+        steps = BaseWorkflow._all_steps_cache.get(cls)
+
+        if steps is None:
+            steps = tuple(
+                itertools.chain(
+                    self.default_steps, self.concurrency_actions, self.on_failure_steps
+                )
+            )
+            BaseWorkflow._all_steps_cache[cls] = steps
+
+        return list(steps)
 
     def create_action_name(self, namespace: str, step: Step[Any]) -> str:
         return self.get_service_name(namespace) + ":" + step.name
@@ -424,6 +522,9 @@ class BaseWorkflow:
         )
 
     def validate_priority(self, default_priority: int | None) -> int | None:
+        if default_priority is None or 1 <= default_priority <= 3:
+            return default_priority
+
         validated_priority = (
             max(1, min(3, default_priority)) if default_priority else None
         )
@@ -437,53 +538,46 @@ class BaseWorkflow:
     def validate_concurrency(
         self, concurrency: ConcurrencyLimitStrategy | None
     ) -> int | None:
-        if not concurrency:
-            return None
-
-        names = [item.name for item in ConcurrencyLimitStrategyProto.DESCRIPTOR.values]
-
-        for name in names:
-            if name == concurrency.name:
-                return StickyStrategyProto.Value(concurrency.name)
-
-        raise ValueError(
-            f"Concurrency limit strategy must be one of {names}. Got: {concurrency}"
-        )
+        return _concurrency_limit_strategy_to_proto(concurrency)
 
     def validate_sticky(self, sticky: StickyStrategy | None) -> int | None:
-        if not sticky:
-            return None
+        return _sticky_strategy_to_proto(sticky)
 
-        names = [item.name for item in StickyStrategyProto.DESCRIPTOR.values]
+    def _get_step_opts(self, service_name: str) -> tuple[CreateWorkflowStepOpts, ...]:
+        # The step opts only depend on the class's steps and the service name, so they're built once
+        # per pair. Protobuf copies them into the job opts, which leaves the cached messages untouched.
+        key = (self.__class__, service_name)
+        step_opts = BaseWorkflow._step_opts_cache.get(key)
 
-        for name in names:
-            if name == sticky.name:
-                return StickyStrategyProto.Value(sticky.name)
+        if step_opts is None:
+            action_prefix = service_name + ":"
 
-        raise ValueError(f"Sticky strategy must be one of {names}. Got: {sticky}")
+            step_opts = tuple(
+                CreateWorkflowStepOpts(
+                    readable_id=step.name,
+                    action=action_prefix + step.name,
+                    timeout=step.timeout or "60s",
+                    inputs="{}",
+                    parents=step.parents,
+                    retries=step.retries,
+                    rate_limits=step.rate_limits,
+                    worker_labels=step.desired_worker_labels,
+                    backoff_factor=step.backoff_factor,
+                    backoff_max_seconds=step.backoff_max_seconds,
+                )
+                for step in self.default_steps
+            )
+            BaseWorkflow._step_opts_cache[key] = step_opts
+
+        return step_opts
 
     def get_create_opts(self, namespace: str) -> CreateWorkflowVersionOpts:
         service_name = self.get_service_name(namespace)
 
         name = self.get_name(namespace)
-        event_triggers = [namespace + event for event in self.config.on_events]
-
-        create_step_opts = [
-            CreateWorkflowStepOpts(
-                readable_id=step.name,
-                action=service_name + ":" + step.name,
-                timeout=step.timeout or "60s",
-                inputs="{}",
-                parents=[x for x in step.parents],
-                retries=step.retries,
-                rate_limits=step.rate_limits,
-                worker_labels=step.desired_worker_labels,
-                backoff_factor=step.backoff_factor,
-                backoff_max_seconds=step.backoff_max_seconds,
-            )
-            for step in self.steps
-            if step.type == StepType.DEFAULT
-        ]
+        event_triggers = map(namespace.__add__, self.config.on_events)
+
+        create_step_opts = self._get_step_opts(service_name)
 
         concurrency = self.validate_concurrency_actions(service_name)
         on_failure_job = self.validate_on_failure_steps(name, service_name)
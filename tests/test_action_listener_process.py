@@ -0,0 +1,76 @@
+import queue
+
+import pytest
+
+from hatchet_sdk.clients.dispatcher.action_listener import Action
+from hatchet_sdk.contracts.dispatcher_pb2 import (
+    STEP_EVENT_TYPE_COMPLETED,
+    STEP_EVENT_TYPE_STARTED,
+    ActionType,
+)
+from hatchet_sdk.loader import ClientConfig
+from hatchet_sdk.worker.action_listener_process import (
+    RUN_RELEASED,
+    ActionEvent,
+    WorkerActionListenerProcess,
+)
+
+
+def make_process() -> WorkerActionListenerProcess:
+    return WorkerActionListenerProcess(
+        "worker",
+        [],
+        1,
+        ClientConfig(),
+        queue.Queue(),  # type: ignore[arg-type]
+        queue.Queue(),  # type: ignore[arg-type]
+    )
+
+
+def make_action() -> Action:
+    return Action(
+        worker_id="worker",
+        tenant_id="tenant",
+        workflow_run_id="run",
+        get_group_key_run_id="",
+        job_id="job",
+        job_name="job",
+        job_run_id="job-run",
+        step_id="step",
+        step_run_id="step-run",
+        action_id="wf:step",
+        action_type=ActionType.START_STEP_RUN,
+        retry_count=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_runner_events_are_resolved_to_their_action() -> None:
+    process = make_process()
+    action = make_action()
+    process.actions_by_run_id[action.step_run_id] = action
+
+    assert process._resolve_runner_event(
+        ("step-run", STEP_EVENT_TYPE_STARTED, "")
+    ) == ActionEvent(action=action, type=STEP_EVENT_TYPE_STARTED, payload="")
+
+    # The action is released once the run has finished
+    assert process._resolve_runner_event(
+        ("step-run", STEP_EVENT_TYPE_COMPLETED, "{}")
+    ) == ActionEvent(action=action, type=STEP_EVENT_TYPE_COMPLETED, payload="{}")
+    assert process.actions_by_run_id == {}
+
+    assert (
+        process._resolve_runner_event(("step-run", STEP_EVENT_TYPE_COMPLETED, "{}"))
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_released_runs_drop_their_action_without_an_event() -> None:
+    process = make_process()
+    action = make_action()
+    process.actions_by_run_id[action.step_run_id] = action
+
+    assert process._resolve_runner_event(("step-run", RUN_RELEASED, "")) is None
+    assert process.actions_by_run_id == {}
@@ -0,0 +1,28 @@
+import contextvars
+import threading
+
+import pytest
+
+from hatchet_sdk.utils.aio_utils import to_thread_fast
+
+var: contextvars.ContextVar[str] = contextvars.ContextVar("var")
+
+
+def current_thread_and_var() -> tuple[int, str | None]:
+    return threading.get_ident(), var.get(None)
+
+
+@pytest.mark.asyncio
+async def test_to_thread_fast_runs_off_loop() -> None:
+    thread_id, _ = await to_thread_fast(current_thread_and_var)
+
+    assert thread_id != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_to_thread_fast_propagates_context() -> None:
+    var.set("value")
+
+    _, value = await to_thread_fast(current_thread_and_var)
+
+    assert value == "value"
@@ -1,3 +1,5 @@
+import pytest
+
 from hatchet_sdk.loader import ClientConfig
 
 
@@ -13,3 +15,17 @@ def test_client_host_port_overrides() -> None:
 
     assert ClientConfig().host_port != host_port
     assert ClientConfig().server_url != host_port
+
+
+def test_client_config_hash() -> None:
+    config = ClientConfig(namespace="test")
+
+    assert hash(config) == hash(config)
+    assert hash(config) == hash(ClientConfig(namespace="test"))
+    assert hash(config) != hash(ClientConfig(namespace="other"))
+    assert config == ClientConfig(namespace="test")
+
+
+def test_enable_force_kill_sync_threads_is_deprecated() -> None:
+    with pytest.warns(DeprecationWarning, match="enable_force_kill_sync_threads"):
+        ClientConfig(enable_force_kill_sync_threads=True)
@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from hatchet_sdk.connection import (
+    _cached_channel_credentials,
+    _load_channel_credentials,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials_cache() -> None:
+    _cached_channel_credentials.cache_clear()
+
+
+def test_credentials_are_loaded_once_per_files(tmp_path: Path) -> None:
+    root_ca = tmp_path / "ca.pem"
+    root_ca.write_bytes(b"not a real cert")
+
+    first = _load_channel_credentials("tls", str(root_ca), None, None)
+    second = _load_channel_credentials("tls", str(root_ca), None, None)
+
+    assert first is second
+    assert _cached_channel_credentials.cache_info().misses == 1
+
+
+def test_credentials_are_reloaded_once_files_change(tmp_path: Path) -> None:
+    root_ca = tmp_path / "ca.pem"
+    root_ca.write_bytes(b"not a real cert")
+
+    first = _load_channel_credentials("tls", str(root_ca), None, None)
+
+    # Rotated certificates get a newer modification time
+    root_ca.write_bytes(b"still not a real cert")
+    mtime_ns = os.stat(root_ca).st_mtime_ns + 1_000_000_000
+    os.utime(root_ca, ns=(mtime_ns, mtime_ns))
+
+    assert _load_channel_credentials("tls", str(root_ca), None, None) is not first
+
+
+def test_no_credentials_without_tls() -> None:
+    assert _load_channel_credentials("none", None, None, None) is None
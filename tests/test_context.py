@@ -0,0 +1,77 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+from hatchet_sdk.clients.dispatcher.action_listener import Action
+from hatchet_sdk.context.context import Context
+from hatchet_sdk.contracts.dispatcher_pb2 import ActionType
+from hatchet_sdk.utils.types import WorkflowValidator
+
+
+class FirstOutput(BaseModel):
+    value: int
+
+
+class OtherOutput(BaseModel):
+    other: str = ""
+
+
+def make_context(action_id: str, payload: dict[str, Any]) -> Context:
+    action = Action(
+        worker_id="worker",
+        tenant_id="tenant",
+        workflow_run_id="run",
+        get_group_key_run_id="",
+        job_id="job",
+        job_name="job",
+        job_run_id="job-run",
+        step_id="step",
+        step_run_id="step-run",
+        action_id=action_id,
+        action_type=ActionType.START_STEP_RUN,
+        retry_count=0,
+        action_payload=payload,
+    )
+
+    return Context(
+        action,
+        None,  # type: ignore[arg-type]
+        None,  # type: ignore[arg-type]
+        None,  # type: ignore[arg-type]
+        None,  # type: ignore[arg-type]
+        None,
+        None,  # type: ignore[arg-type]
+        None,  # type: ignore[arg-type]
+        validator_registry={
+            # Another workflow with a step of the same name must not be picked up
+            "other:first": WorkflowValidator(step_output=OtherOutput),
+            "wf:first": WorkflowValidator(step_output=FirstOutput),
+            "wf:second": WorkflowValidator(),
+        },
+    )
+
+
+def test_step_output_uses_validator_from_own_workflow() -> None:
+    ctx = make_context(
+        "wf:second", {"input": {}, "parents": {"first": {"value": 1}, "raw": {"a": 1}}}
+    )
+
+    assert ctx.step_output("first") == FirstOutput(value=1)
+    assert ctx.step_output("raw") == {"a": 1}
+
+
+def test_action_otel_attributes_are_computed_once() -> None:
+    action = make_context("wf:first", {"input": {"a": 1}}).action
+
+    assert action.otel_attributes["hatchet.action_payload"] == '{"input": {"a": 1}}'
+    assert action.otel_attributes is action.otel_attributes
+
+
+def test_exit_flag_follows_cancel_token() -> None:
+    ctx = make_context("wf:first", {"input": {}})
+
+    ctx.exit_flag = True
+    assert ctx.done() and ctx.cancel_token.is_set()
+
+    ctx.exit_flag = False
+    assert not ctx.done()
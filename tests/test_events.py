@@ -0,0 +1,335 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import grpc
+import pytest
+
+from hatchet_sdk.clients.events import (
+    AIO_BULK_PUSH_OFFLOAD_THRESHOLD,
+    BulkPushEventOptions,
+    BulkPushEventWithMetadata,
+    EventClient,
+    PushEventOptions,
+    proto_timestamp_now,
+)
+from hatchet_sdk.contracts.events_pb2 import (
+    BulkPushEventRequest,
+    Event,
+    PushEventRequest,
+)
+from hatchet_sdk.contracts.events_pb2_grpc import (
+    EventsServiceServicer,
+    add_EventsServiceServicer_to_server,
+)
+from hatchet_sdk.loader import ClientConfig, ClientTLSConfig
+
+
+class FakeEventsStub:
+    def __init__(self) -> None:
+        self.requests: list[Any] = []
+        self.kwargs: list[dict[str, Any]] = []
+
+    def Push(self, request: PushEventRequest, **kwargs: Any) -> PushEventRequest:
+        self.requests.append(request)
+        return request
+
+    def BulkPush(self, request: BulkPushEventRequest, **kwargs: Any) -> Any:
+        self.requests.append(request)
+        self.kwargs.append(kwargs)
+        return request
+
+    def PutStreamEvent(self, request: Any, **kwargs: Any) -> None:
+        self.requests.append(request)
+
+
+class FakeAsyncEventsStub:
+    def __init__(self) -> None:
+        self.requests: list[Any] = []
+
+    async def Push(self, request: PushEventRequest, **kwargs: Any) -> PushEventRequest:
+        self.requests.append(request)
+        return request
+
+    async def BulkPush(self, request: BulkPushEventRequest, **kwargs: Any) -> Any:
+        self.requests.append(request)
+        return request
+
+    async def PutLog(self, request: Any, **kwargs: Any) -> None:
+        self.requests.append(request)
+
+    async def PutStreamEvent(self, request: Any, **kwargs: Any) -> None:
+        self.requests.append(request)
+
+
+def use_aio_stub(event_client: EventClient, aio_stub: FakeAsyncEventsStub) -> None:
+    event_client._aio_client = aio_stub  # type: ignore[assignment]
+    event_client._aio_loop = asyncio.get_running_loop()
+
+
+@pytest.fixture
+def stub() -> FakeEventsStub:
+    return FakeEventsStub()
+
+
+@pytest.fixture
+def event_client(stub: FakeEventsStub) -> EventClient:
+    return EventClient(client=stub, config=ClientConfig(namespace="test"))  # type: ignore[arg-type]
+
+
+def test_push_encodes_payload_and_metadata(
+    event_client: EventClient, stub: FakeEventsStub
+) -> None:
+    event_client.push(
+        "user:create",
+        {"name": "hatchet", "count": 3},
+        PushEventOptions(additional_metadata={"source": "test"}),
+    )
+
+    request = stub.requests[0]
+
+    assert request.key == "test_user:create"
+    assert json.loads(request.payload) == {"name": "hatchet", "count": 3}
+    assert json.loads(request.additionalMetadata) == {"source": "test"}
+
+
+def test_push_rejects_unserializable_payload(event_client: EventClient) -> None:
+    with pytest.raises(ValueError, match="Error encoding payload"):
+        event_client.push("user:create", {"value": object()})
+
+
+def test_bulk_push_namespaces_every_event(
+    event_client: EventClient, stub: FakeEventsStub
+) -> None:
+    event_client.bulk_push(
+        [
+            BulkPushEventWithMetadata(key="a", payload={"i": 1}),
+            BulkPushEventWithMetadata(
+                key="b", payload={"i": 2}, additional_metadata={"k": "v"}
+            ),
+        ],
+        BulkPushEventOptions(namespace="other_"),
+    )
+
+    request = stub.requests[0]
+
+    assert [e.key for e in request.events] == ["other_a", "other_b"]
+    assert [json.loads(e.payload) for e in request.events] == [{"i": 1}, {"i": 2}]
+    assert json.loads(request.events[1].additionalMetadata) == {"k": "v"}
+
+
+@pytest.mark.parametrize(
+    "enabled,expected",
+    [(True, grpc.Compression.Gzip), (False, grpc.Compression.NoCompression)],
+)
+def test_bulk_push_compression(
+    stub: FakeEventsStub, enabled: bool, expected: grpc.Compression
+) -> None:
+    client = EventClient(
+        client=stub, config=ClientConfig(grpc_compression=enabled)  # type: ignore[arg-type]
+    )
+
+    client.bulk_push([BulkPushEventWithMetadata(key="a", payload={})])
+
+    assert stub.kwargs[0]["compression"] == expected
+
+
+def test_stream_accepts_str_and_bytes(
+    event_client: EventClient, stub: FakeEventsStub
+) -> None:
+    event_client.stream(b"raw", "step-run")
+    event_client.stream("text", "step-run")
+
+    assert [r.message for r in stub.requests] == [b"raw", b"text"]
+
+    with pytest.raises(ValueError):
+        event_client.stream(1, "step-run")  # type: ignore[arg-type]
+
+
+def test_proto_timestamp_now_is_current() -> None:
+    before = time.time_ns()
+    ts = proto_timestamp_now()
+    after = time.time_ns()
+
+    assert 0 <= ts.nanos < 1_000_000_000
+    assert before <= ts.ToNanoseconds() <= after
+
+
+def test_calls_round_robin_across_pool() -> None:
+    stubs = [FakeEventsStub(), FakeEventsStub()]
+    client = EventClient(
+        client=stubs[0], config=ClientConfig(), pool=stubs  # type: ignore[arg-type]
+    )
+
+    for i in range(4):
+        client.push("key", {"i": i})
+
+    assert [len(stub.requests) for stub in stubs] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_aio_push_uses_async_stub(event_client: EventClient) -> None:
+    aio_stub = FakeAsyncEventsStub()
+    use_aio_stub(event_client, aio_stub)
+
+    await event_client.aio_push("user:create", {"test": "test"})
+    await event_client.aio_bulk_push([BulkPushEventWithMetadata(key="a", payload={})])
+
+    push_request, bulk_request = aio_stub.requests
+
+    assert push_request.key == "test_user:create"
+    assert [e.key for e in bulk_request.events] == ["test_a"]
+
+
+@pytest.mark.asyncio
+async def test_aio_log_and_stream_use_async_stub(event_client: EventClient) -> None:
+    aio_stub = FakeAsyncEventsStub()
+    use_aio_stub(event_client, aio_stub)
+
+    await event_client.aio_log("line", "step-run")
+    await event_client.aio_stream("chunk", "step-run")
+
+    log_request, stream_request = aio_stub.requests
+
+    assert log_request.message == "line"
+    assert stream_request.message == b"chunk"
+
+
+@pytest.mark.asyncio
+async def test_aio_bulk_push_encodes_large_batches_off_loop(
+    event_client: EventClient,
+) -> None:
+    aio_stub = FakeAsyncEventsStub()
+    use_aio_stub(event_client, aio_stub)
+
+    events = [
+        BulkPushEventWithMetadata(key=str(i), payload={"i": i})
+        for i in range(AIO_BULK_PUSH_OFFLOAD_THRESHOLD)
+    ]
+
+    await event_client.aio_bulk_push(events)
+
+    assert len(aio_stub.requests[0].events) == AIO_BULK_PUSH_OFFLOAD_THRESHOLD
+
+
+def test_push_batched_coalesces_into_bulk_push(stub: FakeEventsStub) -> None:
+    client = EventClient(
+        client=stub,  # type: ignore[arg-type]
+        config=ClientConfig(event_batch_window_ms=60_000, event_batch_max_size=3),
+    )
+
+    for i in range(3):
+        client.push_batched("key", {"i": i})
+
+    client.push_batched("key", {"i": 3})
+    client.close()
+
+    assert [[json.loads(e.payload)["i"] for e in r.events] for r in stub.requests] == [
+        [0, 1, 2],
+        [3],
+    ]
+
+
+def test_push_batched_flushes_after_window(
+    event_client: EventClient, stub: FakeEventsStub
+) -> None:
+    event_client.push_batched("key", {})
+
+    deadline = time.monotonic() + 5
+    while not stub.requests and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [e.key for e in stub.requests[0].events] == ["test_key"]
+
+    event_client.close()
+
+    with pytest.raises(RuntimeError):
+        event_client.push_batched("key", {})
+
+
+class BlockingEventsStub(FakeEventsStub):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sending = threading.Event()
+        self.release = threading.Event()
+
+    def BulkPush(self, request: BulkPushEventRequest, **kwargs: Any) -> Any:
+        self.sending.set()
+        self.release.wait(timeout=5)
+        return super().BulkPush(request, **kwargs)
+
+
+def test_flush_waits_for_batches_already_being_sent() -> None:
+    stub = BlockingEventsStub()
+    client = EventClient(
+        client=stub,  # type: ignore[arg-type]
+        config=ClientConfig(event_batch_max_size=1),
+    )
+
+    client.push_batched("key", {})
+    assert stub.sending.wait(timeout=5)
+
+    flusher = threading.Thread(target=client.flush)
+    flusher.start()
+    flusher.join(timeout=0.1)
+
+    assert flusher.is_alive()
+
+    stub.release.set()
+    flusher.join(timeout=5)
+
+    assert not flusher.is_alive()
+    assert len(stub.requests) == 1
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_aio_bulk_push_works_after_close(event_client: EventClient) -> None:
+    aio_stub = FakeAsyncEventsStub()
+    use_aio_stub(event_client, aio_stub)
+    event_client.close()
+
+    await event_client.aio_bulk_push(
+        [
+            BulkPushEventWithMetadata(key=str(i), payload={})
+            for i in range(AIO_BULK_PUSH_OFFLOAD_THRESHOLD)
+        ]
+    )
+
+    assert len(aio_stub.requests[0].events) == AIO_BULK_PUSH_OFFLOAD_THRESHOLD
+
+
+class RecordingEventsServicer(EventsServiceServicer):
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+
+    def Push(self, request: PushEventRequest, context: Any) -> Event:
+        self.keys.append(request.key)
+        return Event(key=request.key)
+
+
+def test_aio_push_works_across_event_loops() -> None:
+    servicer = RecordingEventsServicer()
+    server = grpc.server(ThreadPoolExecutor(max_workers=2))
+    add_EventsServiceServicer_to_server(servicer, server)  # type: ignore[no-untyped-call]
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    try:
+        config = ClientConfig(
+            host_port=f"localhost:{port}",
+            tls_config=ClientTLSConfig(strategy="none"),
+        )
+        client = EventClient(client=None, config=config)  # type: ignore[arg-type]
+
+        # Each `asyncio.run` closes its loop, so the second push needs a channel of its own
+        asyncio.run(client.aio_push("first", {}))
+        asyncio.run(client.aio_push("second", {}))
+
+        assert servicer.keys == ["first", "second"]
+    finally:
+        server.stop(None)
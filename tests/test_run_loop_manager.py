@@ -0,0 +1,59 @@
+import asyncio
+import queue
+from typing import Any
+
+import pytest
+
+from hatchet_sdk.clients.dispatcher.action_listener import Action
+from hatchet_sdk.loader import ClientConfig
+from hatchet_sdk.worker.runner.run_loop_manager import (
+    ACTION_QUEUE_BATCH_SIZE,
+    WorkerActionRunLoopManager,
+)
+
+
+def make_manager(
+    action_queue: "queue.Queue[Any]", loop: asyncio.AbstractEventLoop
+) -> WorkerActionRunLoopManager:
+    return WorkerActionRunLoopManager(
+        "worker",
+        {},
+        {},
+        None,
+        ClientConfig(),
+        action_queue,  # type: ignore[arg-type]
+        queue.Queue(),  # type: ignore[arg-type]
+        loop,
+    )
+
+
+@pytest.mark.asyncio
+async def test_construction_does_not_schedule_a_task() -> None:
+    loop = asyncio.get_running_loop()
+    before = asyncio.all_tasks(loop)
+
+    manager = make_manager(queue.Queue(), loop)
+
+    assert asyncio.all_tasks(loop) == before
+
+    manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_get_actions_drains_queue_in_batches() -> None:
+    action_queue: "queue.Queue[Any]" = queue.Queue()
+    actions: list[Action] = [object() for _ in range(ACTION_QUEUE_BATCH_SIZE + 1)]  # type: ignore[misc]
+
+    for action in actions:
+        action_queue.put(action)
+
+    manager = make_manager(action_queue, asyncio.get_running_loop())
+
+    assert await manager._get_actions() == actions[:ACTION_QUEUE_BATCH_SIZE]
+    assert await manager._get_actions() == actions[ACTION_QUEUE_BATCH_SIZE:]
+
+    manager.killing = True
+
+    assert await manager._get_actions() == []
+
+    manager.cleanup()
@@ -0,0 +1,411 @@
+import asyncio
+import json
+import logging
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from hatchet_sdk.clients.dispatcher.action_listener import Action
+from hatchet_sdk.context.context import Context
+from hatchet_sdk.contracts.dispatcher_pb2 import (
+    STEP_EVENT_TYPE_COMPLETED,
+    STEP_EVENT_TYPE_FAILED,
+    STEP_EVENT_TYPE_STARTED,
+    ActionType,
+)
+from hatchet_sdk.logger import logger
+from hatchet_sdk.worker.action_listener_process import RUN_RELEASED
+from hatchet_sdk.worker.runner import runner as runner_module
+from hatchet_sdk.worker.runner.runner import (
+    Runner,
+    RunState,
+    _cpu_pinning_initializer,
+    _parse_cpulist,
+    errorWithTraceback,
+)
+from hatchet_sdk.worker.runner.utils.capture_logs import sr, wr
+from hatchet_sdk.workflow import BaseWorkflow, Step, StepType
+
+
+async def succeed(self: Any, context: Context) -> dict[str, int]:
+    return {"ok": 1}
+
+
+def current_run_ids(self: Any, context: Context) -> dict[str, str | None]:
+    return {"workflow_run_id": wr.get(), "step_run_id": sr.get()}
+
+
+async def fail(self: Any, context: Context) -> None:
+    raise ValueError("boom")
+
+
+async def hang(self: Any, context: Context) -> None:
+    await asyncio.sleep(60)
+
+
+async def cooperative(self: Any, context: Context) -> None:
+    while not context.done():
+        await asyncio.sleep(0.01)
+
+
+def check_cancel(self: Any, context: Context) -> None:
+    while True:
+        context.check_cancel()
+        time.sleep(0.01)
+
+
+class RunnerWorkflow(BaseWorkflow):
+    succeed: Step[dict[str, int]] = Step(succeed, StepType.DEFAULT, name="succeed")
+    sync: Step[dict[str, str | None]] = Step(
+        current_run_ids, StepType.DEFAULT, name="sync"
+    )
+    fail: Step[None] = Step(fail, StepType.DEFAULT, name="fail")
+    hang: Step[None] = Step(hang, StepType.DEFAULT, name="hang")
+    cooperative: Step[None] = Step(cooperative, StepType.DEFAULT, name="cooperative")
+    check_cancel: Step[None] = Step(check_cancel, StepType.DEFAULT, name="check_cancel")
+
+
+RunnerFactory = Callable[..., Runner]
+
+
+@pytest.fixture
+def make_runner() -> Iterator[RunnerFactory]:
+    runners: list[Runner] = []
+
+    def make(event_queue: "queue.Queue[Any] | None" = None, **kwargs: Any) -> Runner:
+        if event_queue is None:
+            event_queue = queue.Queue()
+
+        runner = Runner("worker", event_queue, **kwargs)  # type: ignore[arg-type]
+        runners.append(runner)
+
+        return runner
+
+    yield make
+
+    # Every runner starts an event drainer thread, which would otherwise outlive the test
+    for runner in runners:
+        runner.stop_event_drainer()
+
+
+def make_action(step_name: str) -> Action:
+    return Action(
+        worker_id="worker",
+        tenant_id="tenant",
+        workflow_run_id="run",
+        get_group_key_run_id="",
+        job_id="job",
+        job_name="job",
+        job_run_id="job-run",
+        step_id=step_name,
+        step_run_id=step_name,
+        action_id=f"wf:{step_name}",
+        action_type=ActionType.START_STEP_RUN,
+        retry_count=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_events_are_sent_in_batches(
+    make_runner: RunnerFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Nothing below waits anywhere near the window, so any wait for it would time out the `get`
+    monkeypatch.setattr(runner_module, "EVENT_BATCH_WINDOW_SECONDS", 5)
+    monkeypatch.setattr(runner_module, "EVENT_BATCH_MAX_SIZE", 2)
+
+    event_queue: "queue.Queue[Any]" = queue.Queue()
+    runner = make_runner(event_queue)
+
+    # An isolated event is sent right away
+    runner._put_event("a", STEP_EVENT_TYPE_STARTED, "")
+
+    assert event_queue.get(timeout=1) == [("a", STEP_EVENT_TYPE_STARTED, "")]
+
+    # Events right after it are batched, and a full batch doesn't wait out the window
+    for run_id in ("a", "b"):
+        runner._put_event(run_id, STEP_EVENT_TYPE_COMPLETED, "{}")
+
+    assert event_queue.get(timeout=1) == [
+        ("a", STEP_EVENT_TYPE_COMPLETED, "{}"),
+        ("b", STEP_EVENT_TYPE_COMPLETED, "{}"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stopping_the_event_drainer_sends_pending_events(
+    make_runner: RunnerFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(runner_module, "EVENT_BATCH_WINDOW_SECONDS", 5)
+
+    event_queue: "queue.Queue[Any]" = queue.Queue()
+    runner = make_runner(event_queue)
+
+    runner._put_event("a", STEP_EVENT_TYPE_STARTED, "")
+    assert event_queue.get(timeout=1) == [("a", STEP_EVENT_TYPE_STARTED, "")]
+
+    # Held back by the window, until the drainer is stopped
+    runner._put_event("b", STEP_EVENT_TYPE_STARTED, "")
+    runner.stop_event_drainer()
+
+    assert not runner._event_drainer.is_alive()
+    assert event_queue.get_nowait() == [("b", STEP_EVENT_TYPE_STARTED, "")]
+
+    # Events after that are sent on their own
+    runner._put_event("a", STEP_EVENT_TYPE_COMPLETED, "{}")
+    assert event_queue.get_nowait() == [("a", STEP_EVENT_TYPE_COMPLETED, "{}")]
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "sched_setaffinity"), reason="CPU affinity is Linux only"
+)
+def test_cpu_pinning_only_applies_to_pool_threads() -> None:
+    allowed = os.sched_getaffinity(0)
+    initializer = _cpu_pinning_initializer()
+
+    with ThreadPoolExecutor(max_workers=1, initializer=initializer) as pool:
+        pinned = pool.submit(os.sched_getaffinity, 0).result()
+
+    assert len(pinned) == 1 and pinned <= allowed
+    assert os.sched_getaffinity(0) == allowed
+
+
+@pytest.mark.parametrize(
+    "cpulist,expected",
+    [
+        ("0", {0}),
+        ("0-3\n", {0, 1, 2, 3}),
+        ("0-1,8-9,12", {0, 1, 8, 9, 12}),
+        ("", set()),
+    ],
+)
+def test_parse_cpulist(cpulist: str, expected: set[int]) -> None:
+    assert _parse_cpulist(cpulist) == expected
+
+
+@pytest.mark.asyncio
+async def test_wait_for_tasks_returns_once_tasks_are_cleaned_up(
+    make_runner: RunnerFactory,
+) -> None:
+    runner = make_runner()
+
+    await asyncio.wait_for(runner.wait_for_tasks(), timeout=1)
+
+    runner.runs["run"] = RunState(
+        runner.create_context(make_action("run")), asyncio.create_task(asyncio.sleep(0))
+    )
+    runner._tasks_drained.clear()
+
+    waiter = asyncio.create_task(runner.wait_for_tasks())
+    await asyncio.sleep(0.05)
+
+    assert not waiter.done()
+
+    runner.cleanup_run_id("run")
+
+    await asyncio.wait_for(waiter, timeout=0.5)
+
+
+def test_error_with_traceback() -> None:
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        message = errorWithTraceback(f"{e}", e)
+
+    assert message.startswith("boom\nTraceback (most recent call last):")
+    assert message.endswith("ValueError: boom\n")
+
+
+@pytest.mark.asyncio
+async def test_serialize_output(make_runner: RunnerFactory) -> None:
+    runner = make_runner()
+
+    assert json.loads(runner.serialize_output({"a": [1, 2], 3: None})) == {
+        "a": [1, 2],
+        "3": None,
+    }
+    assert runner.serialize_output(None) == ""
+    assert json.loads(runner.serialize_output({"n": 2**70})) == {"n": 2**70}
+    assert runner.serialize_output({"value": object()}).startswith("{'value'")
+
+
+class FrozenOutput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    value: int
+
+
+class FrozenListOutput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    values: list[int]
+
+
+@pytest.mark.asyncio
+async def test_serialize_output_caches_frozen_models(
+    make_runner: RunnerFactory,
+) -> None:
+    runner = make_runner()
+    output = FrozenOutput(value=1)
+
+    assert runner.serialize_output(output) == '{"value":1}'
+    assert runner.serialize_output(output) is runner.serialize_output(output)
+    assert len(runner._frozen_output_json) == 1
+
+    # Unhashable frozen models are still serialized every time
+    mutable = FrozenListOutput(values=[1])
+    assert runner.serialize_output(mutable) == '{"values":[1]}'
+    mutable.values.append(2)
+    assert runner.serialize_output(mutable) == '{"values":[1,2]}'
+
+    del output
+    assert len(runner._frozen_output_json) == 0
+
+
+class FrozenScalarOutput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    value: float | int | bool
+
+
+@pytest.mark.asyncio
+async def test_serialize_output_does_not_reuse_json_of_equal_models(
+    make_runner: RunnerFactory,
+) -> None:
+    runner = make_runner()
+    outputs = [FrozenScalarOutput(value=v) for v in (1, True, 1.0)]
+
+    # All three compare equal, but each dumps differently
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert [runner.serialize_output(o) for o in outputs] == [
+        '{"value":1}',
+        '{"value":true}',
+        '{"value":1.0}',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_handle_start_step_run_reports_the_result(
+    make_runner: RunnerFactory,
+) -> None:
+    workflow = RunnerWorkflow()
+    event_queue: "queue.Queue[Any]" = queue.Queue()
+    runner = make_runner(
+        event_queue, action_registry={f"wf:{s.name}": s for s in workflow.steps}
+    )
+
+    await runner.handle_start_step_run(make_action("succeed"))
+    await runner.handle_start_step_run(make_action("fail"))
+
+    hung = asyncio.create_task(runner.handle_start_step_run(make_action("hang")))
+    await asyncio.sleep(0.05)
+    runner.runs["hang"].task.cancel()
+    await hung
+
+    await runner.handle_start_step_run(make_action("unregistered"))
+
+    events: list[Any] = []
+    while len(events) < 7:
+        events.extend(event_queue.get(timeout=5))
+
+    assert [(run_id, event_type) for run_id, event_type, _ in events] == [
+        ("succeed", STEP_EVENT_TYPE_STARTED),
+        ("succeed", STEP_EVENT_TYPE_COMPLETED),
+        ("fail", STEP_EVENT_TYPE_STARTED),
+        ("fail", STEP_EVENT_TYPE_FAILED),
+        ("hang", STEP_EVENT_TYPE_STARTED),
+        ("hang", RUN_RELEASED),
+        ("unregistered", RUN_RELEASED),
+    ]
+    assert json.loads(events[1][2]) == {"ok": 1}
+    assert events[3][2].startswith("boom\n")
+    assert runner.runs == {}
+
+
+@pytest.mark.asyncio
+async def test_sync_steps_see_run_context_vars(make_runner: RunnerFactory) -> None:
+    workflow = RunnerWorkflow()
+    runner = make_runner()
+    action = make_action("sync")
+    context = runner.create_context(action)
+
+    assert await runner.async_wrapped_action_func(
+        context, workflow.sync, action, action.step_run_id
+    ) == {"workflow_run_id": "run", "step_run_id": "sync"}
+
+
+@pytest.mark.asyncio
+async def test_run_dispatches_on_action_type(make_runner: RunnerFactory) -> None:
+    workflow = RunnerWorkflow()
+    event_queue: "queue.Queue[Any]" = queue.Queue()
+    runner = make_runner(
+        event_queue, action_registry={f"wf:{s.name}": s for s in workflow.steps}
+    )
+
+    runner.run(make_action("succeed"))
+
+    events: list[Any] = []
+    while len(events) < 2:
+        events.extend(await asyncio.to_thread(event_queue.get, timeout=5))
+
+    assert [event_type for _, event_type, _ in events] == [
+        STEP_EVENT_TYPE_STARTED,
+        STEP_EVENT_TYPE_COMPLETED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancel_returns_once_the_run_stops(make_runner: RunnerFactory) -> None:
+    workflow = RunnerWorkflow()
+    runner = make_runner(action_registry={f"wf:{s.name}": s for s in workflow.steps})
+
+    started = asyncio.create_task(
+        runner.handle_start_step_run(make_action("cooperative"))
+    )
+    await asyncio.sleep(0.05)
+
+    await asyncio.wait_for(runner.handle_cancel_action("cooperative"), timeout=0.5)
+    await started
+
+    assert runner.runs == {}
+
+
+@pytest.mark.asyncio
+async def test_sync_step_stops_itself_once_cancelled(
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    make_runner: RunnerFactory,
+) -> None:
+    monkeypatch.setattr(logger, "propagate", True)
+    workflow = RunnerWorkflow()
+    event_queue: "queue.Queue[Any]" = queue.Queue()
+    runner = make_runner(
+        event_queue, action_registry={f"wf:{s.name}": s for s in workflow.steps}
+    )
+
+    started = asyncio.create_task(
+        runner.handle_start_step_run(make_action("check_cancel"))
+    )
+    await asyncio.sleep(0.05)
+
+    await asyncio.wait_for(runner.handle_cancel_action("check_cancel"), timeout=0.5)
+    await started
+
+    events: list[Any] = []
+    while len(events) < 2:
+        events.extend(await asyncio.to_thread(event_queue.get, timeout=5))
+
+    # The run isn't reported as failed, and its thread is free for the next one
+    assert events == [
+        ("check_cancel", STEP_EVENT_TYPE_STARTED, ""),
+        ("check_cancel", RUN_RELEASED, ""),
+    ]
+    await asyncio.sleep(0.05)
+    assert event_queue.empty()
+    assert runner.runs == {}
+    assert runner.thread_pool.submit(lambda: 1).result(timeout=1) == 1
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
@@ -0,0 +1,157 @@
+from typing import Any, cast
+
+import pytest
+
+from hatchet_sdk.context.context import Context
+from hatchet_sdk.contracts.workflows_pb2 import (
+    ConcurrencyLimitStrategy as ConcurrencyLimitStrategyProto,
+)
+from hatchet_sdk.contracts.workflows_pb2 import StickyStrategy as StickyStrategyProto
+from hatchet_sdk.workflow import (
+    BaseWorkflow,
+    ConcurrencyExpression,
+    ConcurrencyLimitStrategy,
+    Step,
+    StepType,
+    StickyStrategy,
+    WorkflowConfig,
+)
+
+
+def step_fn(self: Any, context: Context) -> dict[str, str]:
+    return {"status": "ok"}
+
+
+class DagWorkflow(BaseWorkflow):
+    config = WorkflowConfig(on_events=["dag:create"])
+
+    first = Step(step_fn, StepType.DEFAULT, name="first")
+    second = Step(step_fn, StepType.DEFAULT, name="second", parents=["first"])
+    failure = Step(step_fn, StepType.ON_FAILURE, name="failure")
+
+
+def test_steps_are_grouped_by_type() -> None:
+    workflow = DagWorkflow()
+
+    assert [s.name for s in workflow.default_steps] == ["first", "second"]
+    assert [s.name for s in workflow.on_failure_steps] == ["failure"]
+    assert workflow.concurrency_actions == []
+    assert [s.name for s in workflow.steps] == ["first", "second", "failure"]
+    assert all(step.workflow is workflow for step in workflow.steps)
+
+    # The steps are cached per class, what callers get back is their own copy
+    workflow.steps.clear()
+    workflow.default_steps.reverse()
+
+    assert [s.name for s in DagWorkflow().steps] == ["first", "second", "failure"]
+
+
+def test_get_create_opts() -> None:
+    opts = DagWorkflow().get_create_opts("ns_")
+
+    assert opts.name == "ns_DagWorkflow"
+    assert list(opts.event_triggers) == ["ns_dag:create"]
+    assert [s.action for s in opts.jobs[0].steps] == [
+        "ns_dagworkflow:first",
+        "ns_dagworkflow:second",
+    ]
+    assert list(opts.jobs[0].steps[1].parents) == ["first"]
+    assert opts.on_failure_job.steps[0].action == "ns_dagworkflow:failure"
+
+    assert DagWorkflow().get_create_opts("ns_") == opts
+    assert DagWorkflow().get_create_opts("other_").jobs[0].steps[0].action == (
+        "other_dagworkflow:first"
+    )
+
+
+async def async_step_fn(self: Any, context: Context) -> dict[str, str]:
+    return {"status": "async"}
+
+
+class MixedWorkflow(BaseWorkflow):
+    sync_step = Step(step_fn, StepType.DEFAULT, name="sync_step")
+    async_step: Step[dict[str, str]] = Step(
+        async_step_fn, StepType.DEFAULT, name="async_step"
+    )
+
+
+@pytest.mark.asyncio
+async def test_step_call_dispatch() -> None:
+    workflow = MixedWorkflow()
+    ctx = cast(Context, None)
+
+    assert workflow.sync_step.call(ctx) == {"status": "ok"}
+    assert await workflow.async_step.aio_call(ctx) == {"status": "async"}
+
+    with pytest.raises(TypeError):
+        workflow.async_step.call(ctx)
+
+    with pytest.raises(TypeError):
+        await workflow.sync_step.aio_call(ctx)
+
+
+def test_unregistered_step_cannot_be_called() -> None:
+    with pytest.raises(ValueError):
+        Step(step_fn, StepType.DEFAULT).call(cast(Context, None))
+
+
+class UnhashableStepFn:
+    __hash__ = None  # type: ignore[assignment]
+
+    def __call__(self, workflow: Any, context: Context) -> dict[str, str]:
+        return {"status": "unhashable"}
+
+
+def test_step_accepts_unhashable_callables() -> None:
+    assert not Step(UnhashableStepFn(), StepType.DEFAULT).is_async_function
+
+
+def test_strategy_conversions() -> None:
+    workflow = DagWorkflow()
+
+    assert workflow.validate_sticky(None) is None
+    assert workflow.validate_sticky(StickyStrategy.HARD) == StickyStrategyProto.HARD
+    assert (
+        workflow.validate_concurrency(ConcurrencyLimitStrategy.GROUP_ROUND_ROBIN)
+        == ConcurrencyLimitStrategyProto.GROUP_ROUND_ROBIN
+    )
+
+
+@pytest.mark.parametrize(
+    "priority,expected", [(None, None), (1, 1), (3, 3), (0, None), (-2, 1), (7, 3)]
+)
+def test_validate_priority(priority: int | None, expected: int | None) -> None:
+    assert DagWorkflow().validate_priority(priority) == expected
+
+
+def test_workflow_config_defaults_are_not_shared() -> None:
+    first, second = WorkflowConfig(), WorkflowConfig()
+    first.on_events.append("event")
+
+    assert second.on_events == []
+
+    with pytest.raises(TypeError):
+        WorkflowConfig(unknown=True)  # type: ignore[call-arg]
+
+    events = ["event"]
+    config = WorkflowConfig(on_events=events)
+    config.on_events.append("other")
+
+    assert events == ["event"]
+
+
+def test_workflow_config_coerces_strategies() -> None:
+    config = WorkflowConfig(
+        sticky="SOFT",  # type: ignore[arg-type]
+        concurrency=ConcurrencyExpression("input.user_id", 5, "CANCEL_IN_PROGRESS"),  # type: ignore[arg-type]
+    )
+
+    assert config.sticky is StickyStrategy.SOFT
+    assert DagWorkflow().validate_sticky(config.sticky) == StickyStrategyProto.SOFT
+    assert config.concurrency is not None
+    assert (
+        config.concurrency.limit_strategy is ConcurrencyLimitStrategy.CANCEL_IN_PROGRESS
+    )
+
+    with pytest.raises(ValueError):
+        WorkflowConfig(sticky="sometimes")  # type: ignore[arg-type]